@@ -32,14 +32,25 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._uids_index': ( 'core.html#neuralforecast._uids_index',
+                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.append': ( 'core.html#neuralforecast.append',
+                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.ds': ('core.html#neuralforecast.ds', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.load': ('core.html#neuralforecast.load', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict': ( 'core.html#neuralforecast.predict',
                                                                                      'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
-                                     'neuralforecast.core._cv_dates': ('core.html#_cv_dates', 'neuralforecast/core.py')},
+                                     'neuralforecast.core._LRUCache': ('core.html#_lrucache', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LRUCache.__init__': ('core.html#_lrucache.__init__', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LRUCache.get': ('core.html#_lrucache.get', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._LRUCache.put': ('core.html#_lrucache.put', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._cv_dates': ('core.html#_cv_dates', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._dataset_nbytes': ('core.html#_dataset_nbytes', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._fingerprint': ('core.html#_fingerprint', 'neuralforecast/core.py')},
             'neuralforecast.losses': { 'neuralforecast.losses.MAE': ('losses.html#mae', 'neuralforecast/losses.py'),
                                        'neuralforecast.losses.MAE.__call__': ('losses.html#mae.__call__', 'neuralforecast/losses.py'),
                                        'neuralforecast.losses.MAE.__init__': ('losses.html#mae.__init__', 'neuralforecast/losses.py'),
@@ -446,12 +457,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.VariableSelectionNetwork.forward': ( 'models.tft.html#variableselectionnetwork.forward',
                                                                                                            'neuralforecast/models/tft.py')},
-            'neuralforecast.tsdataset': { 'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
+            'neuralforecast.tsdataset': { 'neuralforecast.tsdataset.LengthBucketSampler': ( 'tsdataset.html#lengthbucketsampler',
+                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LengthBucketSampler.__init__': ( 'tsdataset.html#lengthbucketsampler.__init__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LengthBucketSampler.__iter__': ( 'tsdataset.html#lengthbucketsampler.__iter__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LengthBucketSampler.__len__': ( 'tsdataset.html#lengthbucketsampler.__len__',
+                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._bucket_sampler': ( 'tsdataset.html#timeseriesdatamodule._bucket_sampler',
+                                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._iterable_loader': ( 'tsdataset.html#timeseriesdatamodule._iterable_loader',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._val_sampler': ( 'tsdataset.html#timeseriesdatamodule._val_sampler',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._windows_loader': ( 'tsdataset.html#timeseriesdatamodule._windows_loader',
+                                                                                                             'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.predict_dataloader': ( 'tsdataset.html#timeseriesdatamodule.predict_dataloader',
                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule.predict_order': ( 'tsdataset.html#timeseriesdatamodule.predict_order',
+                                                                                                           'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.train_dataloader': ( 'tsdataset.html#timeseriesdatamodule.train_dataloader',
                                                                                                               'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.val_dataloader': ( 'tsdataset.html#timeseriesdatamodule.val_dataloader',
@@ -462,14 +491,50 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__getitem__': ( 'tsdataset.html#timeseriesdataset.__getitem__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getitems__': ( 'tsdataset.html#timeseriesdataset.__getitems__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getstate__': ( 'tsdataset.html#timeseriesdataset.__getstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__init__': ( 'tsdataset.html#timeseriesdataset.__init__',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__len__': ( 'tsdataset.html#timeseriesdataset.__len__',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__setstate__': ( 'tsdataset.html#timeseriesdataset.__setstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._equal_sizes': ( 'tsdataset.html#timeseriesdataset._equal_sizes',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._extend': ( 'tsdataset.html#timeseriesdataset._extend',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._merged_ds': ( 'tsdataset.html#timeseriesdataset._merged_ds',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._new_rows_mask': ( 'tsdataset.html#timeseriesdataset._new_rows_mask',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._regular': ( 'tsdataset.html#timeseriesdataset._regular',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._serie_rows': ( 'tsdataset.html#timeseriesdataset._serie_rows',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._storage_block': ( 'tsdataset.html#timeseriesdataset._storage_block',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._storage_dtype': ( 'tsdataset.html#timeseriesdataset._storage_dtype',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._take': ( 'tsdataset.html#timeseriesdataset._take',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.ds': ( 'tsdataset.html#timeseriesdataset.ds',
+                                                                                             'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.load': ( 'tsdataset.html#timeseriesdataset.load',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.save': ( 'tsdataset.html#timeseriesdataset.save',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.share_memory': ( 'tsdataset.html#timeseriesdataset.share_memory',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.summary': ( 'tsdataset.html#timeseriesdataset.summary',
+                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
                                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader': ( 'tsdataset.html#timeseriesloader',
@@ -477,5 +542,155 @@ d = { 'settings': { 'branch': 'main',
                                           'neuralforecast.tsdataset.TimeSeriesLoader.__init__': ( 'tsdataset.html#timeseriesloader.__init__',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
-                                                                                                     'neuralforecast/tsdataset.py')},
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._gather_collate': ( 'tsdataset.html#timeseriesloader._gather_collate',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._pad_collate': ( 'tsdataset.html#timeseriesloader._pad_collate',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._static_collate': ( 'tsdataset.html#timeseriesloader._static_collate',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._transform_collate': ( 'tsdataset.html#timeseriesloader._transform_collate',
+                                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesParquetDataset': ( 'tsdataset.html#timeseriesparquetdataset',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesParquetDataset.__init__': ( 'tsdataset.html#timeseriesparquetdataset.__init__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesParquetDataset.__iter__': ( 'tsdataset.html#timeseriesparquetdataset.__iter__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesParquetDataset.__len__': ( 'tsdataset.html#timeseriesparquetdataset.__len__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesParquetDataset._read_serie': ( 'tsdataset.html#timeseriesparquetdataset._read_serie',
+                                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowBank': ( 'tsdataset.html#timeserieswindowbank',
+                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowBank.__getitem__': ( 'tsdataset.html#timeserieswindowbank.__getitem__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowBank.__init__': ( 'tsdataset.html#timeserieswindowbank.__init__',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowBank.__len__': ( 'tsdataset.html#timeserieswindowbank.__len__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowDataset': ( 'tsdataset.html#timeserieswindowdataset',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowDataset.__getitem__': ( 'tsdataset.html#timeserieswindowdataset.__getitem__',
+                                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowDataset.__init__': ( 'tsdataset.html#timeserieswindowdataset.__init__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowDataset.__len__': ( 'tsdataset.html#timeserieswindowdataset.__len__',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowSampler': ( 'tsdataset.html#timeserieswindowsampler',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowSampler.__init__': ( 'tsdataset.html#timeserieswindowsampler.__init__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowSampler.__iter__': ( 'tsdataset.html#timeserieswindowsampler.__iter__',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesWindowSampler.__len__': ( 'tsdataset.html#timeserieswindowsampler.__len__',
+                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal': ( 'tsdataset.html#_chunkedtemporal',
+                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.__getstate__': ( 'tsdataset.html#_chunkedtemporal.__getstate__',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.__init__': ( 'tsdataset.html#_chunkedtemporal.__init__',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.__setstate__': ( 'tsdataset.html#_chunkedtemporal.__setstate__',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.column': ( 'tsdataset.html#_chunkedtemporal.column',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.compact': ( 'tsdataset.html#_chunkedtemporal.compact',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.extend': ( 'tsdataset.html#_chunkedtemporal.extend',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.is_shared': ( 'tsdataset.html#_chunkedtemporal.is_shared',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.nbytes': ( 'tsdataset.html#_chunkedtemporal.nbytes',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.share_memory_': ( 'tsdataset.html#_chunkedtemporal.share_memory_',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._ChunkedTemporal.take': ( 'tsdataset.html#_chunkedtemporal.take',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal': ( 'tsdataset.html#_groupedtemporal',
+                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.__getstate__': ( 'tsdataset.html#_groupedtemporal.__getstate__',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.__init__': ( 'tsdataset.html#_groupedtemporal.__init__',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.__setstate__': ( 'tsdataset.html#_groupedtemporal.__setstate__',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.column': ( 'tsdataset.html#_groupedtemporal.column',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.dtypes': ( 'tsdataset.html#_groupedtemporal.dtypes',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.is_shared': ( 'tsdataset.html#_groupedtemporal.is_shared',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.nbytes': ( 'tsdataset.html#_groupedtemporal.nbytes',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.share_memory_': ( 'tsdataset.html#_groupedtemporal.share_memory_',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._GroupedTemporal.take': ( 'tsdataset.html#_groupedtemporal.take',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal': ( 'tsdataset.html#_sparsetemporal',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.__getstate__': ( 'tsdataset.html#_sparsetemporal.__getstate__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.__init__': ( 'tsdataset.html#_sparsetemporal.__init__',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.__setstate__': ( 'tsdataset.html#_sparsetemporal.__setstate__',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.column': ( 'tsdataset.html#_sparsetemporal.column',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.from_columns': ( 'tsdataset.html#_sparsetemporal.from_columns',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.from_dense': ( 'tsdataset.html#_sparsetemporal.from_dense',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.is_shared': ( 'tsdataset.html#_sparsetemporal.is_shared',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.nbytes': ( 'tsdataset.html#_sparsetemporal.nbytes',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.share_memory_': ( 'tsdataset.html#_sparsetemporal.share_memory_',
+                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._SparseTemporal.take': ( 'tsdataset.html#_sparsetemporal.take',
+                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TensorState': ( 'tsdataset.html#_tensorstate',
+                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TensorState.__init__': ( 'tsdataset.html#_tensorstate.__init__',
+                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._TensorState.unpack': ( 'tsdataset.html#_tensorstate.unpack',
+                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._arrow_factorize': ( 'tsdataset.html#_arrow_factorize',
+                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._check_storage_dtype': ( 'tsdataset.html#_check_storage_dtype',
+                                                                                             'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._column_dtypes': ( 'tsdataset.html#_column_dtypes',
+                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._concat_rows': ( 'tsdataset.html#_concat_rows',
+                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._gather': ('tsdataset.html#_gather', 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._is_mapped': ( 'tsdataset.html#_is_mapped',
+                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._load_npy': ('tsdataset.html#_load_npy', 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._merge_chunks': ( 'tsdataset.html#_merge_chunks',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._pack_state': ( 'tsdataset.html#_pack_state',
+                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._reindex_columns': ( 'tsdataset.html#_reindex_columns',
+                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._save_npy': ('tsdataset.html#_save_npy', 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._select_columns': ( 'tsdataset.html#_select_columns',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._select_rows': ( 'tsdataset.html#_select_rows',
+                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._series_ds': ( 'tsdataset.html#_series_ds',
+                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._series_last_ds': ( 'tsdataset.html#_series_last_ds',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._series_summary': ( 'tsdataset.html#_series_summary',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._share_memory': ( 'tsdataset.html#_share_memory',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._temporal_file': ( 'tsdataset.html#_temporal_file',
+                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._to_arrow': ('tsdataset.html#_to_arrow', 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._to_pandas': ( 'tsdataset.html#_to_pandas',
+                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._unpack_state': ( 'tsdataset.html#_unpack_state',
+                                                                                      'neuralforecast/tsdataset.py')},
             'neuralforecast.utils': {'neuralforecast.utils.generate_series': ('utils.html#generate_series', 'neuralforecast/utils.py')}}}
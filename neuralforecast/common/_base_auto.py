@@ -40,6 +40,8 @@ def tune_model(
     search_alg,
     config,
 ):
+    # The dataset is put once in Ray's object store, trials attach
+    # to its arrays without copying them
     train_fn_with_parameters = tune.with_parameters(
         train_tune,
         cls_model=cls_model,
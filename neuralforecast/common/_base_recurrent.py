@@ -36,6 +36,9 @@ class BaseRecurrent(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        bucket_by_length_loader=False,
+        windows_in_loader=False,
+        val_series_size=None,
         random_seed=1,
         **trainer_kwargs,
     ):
@@ -114,6 +117,19 @@ class BaseRecurrent(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.bucket_by_length_loader = bucket_by_length_loader
+        self.windows_in_loader = windows_in_loader
+
+        # Validation subset, the scaler statistics of each validation batch are cached
+        self.val_series_size = val_series_size
+        self._val_stats_cache = {}
+
+        # Size the batches are left padded to, the longest serie of the dataset
+        self._padded_size = None
+
+        # Positions of the model's columns in the batches, see _temporal_idx
+        self._temporal_cols_idx = None
+        self._static_cols_idx = None
 
     def on_fit_start(self):
         torch.manual_seed(self.random_seed)
@@ -134,26 +150,31 @@ class BaseRecurrent(pl.LightningModule):
     def _normalization(self, batch, val_size=0, test_size=0):
 
         temporal = batch["temporal"]  # B, C, T
-        temporal_cols = batch["temporal_cols"].copy()
+        temporal_idx = self._temporal_idx(batch["temporal_cols"], temporal.device)
 
         # Separate data and mask
-        temporal_data_cols = temporal_cols.drop("available_mask").tolist()
-        temporal_data = temporal[:, temporal_cols.get_indexer(temporal_data_cols), :]
-        temporal_mask = temporal[:, temporal_cols.get_loc("available_mask"), :].clone()
+        temporal_data = temporal[:, temporal_idx["data"], :]
+        temporal_mask = temporal[:, temporal_idx["mask"], :].clone()
 
         # Remove validation and test set to prevent leakeage
         if val_size + test_size > 0:
             cutoff = val_size + test_size
             temporal_mask[:, -cutoff:] = 0
 
-        # Normalize. self.scaler stores the shift and scale for inverse transform
+        # Normalize. self.scaler stores the shift and scale for inverse transform,
+        # cached validation batches come with their statistics
         temporal_mask = temporal_mask.unsqueeze(
             1
         )  # Add channel dimension for scaler.transform.
-        temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
+        temporal_data = self.scaler.transform(
+            x=temporal_data,
+            mask=temporal_mask,
+            x_shift=batch.get("x_shift"),
+            x_scale=batch.get("x_scale"),
+        )
 
         # Replace values in windows dict
-        temporal[:, temporal_cols.get_indexer(temporal_data_cols), :] = temporal_data
+        temporal[:, temporal_idx["data"], :] = temporal_data
         batch["temporal"] = temporal
 
         return batch
@@ -163,13 +184,9 @@ class BaseRecurrent(pl.LightningModule):
         # Broadcasts outputs and inverts normalization
 
         # Get 'y' scale and shift, and add W dimension
-        temporal_data_cols = temporal_cols.drop("available_mask")
-        y_shift = self.scaler.x_shift[
-            :, temporal_data_cols.get_indexer(["y"]), 0
-        ].flatten()  # [B,C,T] -> [B]
-        y_scale = self.scaler.x_scale[
-            :, temporal_data_cols.get_indexer(["y"]), 0
-        ].flatten()  # [B,C,T] -> [B]
+        y_data_idx = self._temporal_idx(temporal_cols, y_hat.device)["y_data"]
+        y_shift = self.scaler.x_shift[:, y_data_idx, 0].flatten()  # [B,C,T] -> [B]
+        y_scale = self.scaler.x_scale[:, y_data_idx, 0].flatten()  # [B,C,T] -> [B]
 
         # Expand scale and shift to y_hat dimensions
         y_shift = y_shift.view(
@@ -196,7 +213,10 @@ class BaseRecurrent(pl.LightningModule):
             # Truncate batch to shorter time-series
             av_condition = torch.nonzero(
                 torch.min(
-                    temporal[:, temporal_cols.get_loc("available_mask")], axis=0
+                    temporal[
+                        :, self._temporal_idx(temporal_cols, temporal.device)["mask"]
+                    ],
+                    axis=0,
                 ).values
             )
             min_time_stamp = int(av_condition.min())
@@ -246,11 +266,64 @@ class BaseRecurrent(pl.LightningModule):
 
         return windows_batch
 
+    def _temporal_idx(self, temporal_cols, device=None):
+        # Positions of the model's temporal columns in the batches, resolved on
+        # the first step of each fit or predict and reused while the columns match.
+        # They are copied to the batches' device once, not on every step
+        cached = self._temporal_cols_idx
+        if cached is None or not (
+            cached[0] is temporal_cols or cached[0].equals(temporal_cols)
+        ):
+            data_cols = temporal_cols.drop("available_mask")
+            idx = dict(
+                data=torch.as_tensor(temporal_cols.get_indexer(data_cols)),
+                y_data=torch.as_tensor(data_cols.get_indexer(["y"])),
+                y=temporal_cols.get_loc("y"),
+                mask=temporal_cols.get_loc("available_mask"),
+                hist_exog=torch.as_tensor(
+                    temporal_cols.get_indexer(self.hist_exog_list)
+                ),
+                futr_exog=torch.as_tensor(
+                    temporal_cols.get_indexer(self.futr_exog_list)
+                ),
+            )
+            cached = self._temporal_cols_idx = (temporal_cols, {None: idx})
+        if device not in cached[1]:
+            cached[1][device] = {
+                name: value.to(device) if torch.is_tensor(value) else value
+                for name, value in cached[1][None].items()
+            }
+        return cached[1][device]
+
+    def _static_idx(self, static_cols, device=None):
+        # Positions of the model's static columns in the batches, on their device
+        cached = self._static_cols_idx
+        if cached is None or not (
+            cached[0] is static_cols or cached[0].equals(static_cols)
+        ):
+            idx = torch.as_tensor(static_cols.get_indexer(self.stat_exog_list))
+            cached = self._static_cols_idx = (static_cols, {None: idx})
+        if device not in cached[1]:
+            cached[1][device] = cached[1][None].to(device)
+        return cached[1][device]
+
+    def _reset_columns_idx(self):
+        # Batches of a new fit or predict can come with other columns
+        self._temporal_cols_idx = None
+        self._static_cols_idx = None
+
+    def _data_cols(self):
+        # Columns read by the model, TimeSeriesDataModule only yields these
+        temporal_cols = ["y"] + self.hist_exog_list + self.futr_exog_list
+        return list(dict.fromkeys(temporal_cols)), self.stat_exog_list
+
     def _parse_windows(self, batch, windows):
         # [B, C, seq_len, 1+H]
         # Filter insample lags from outsample horizon
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        temporal_idx = self._temporal_idx(
+            windows["temporal_cols"], windows["temporal"].device
+        )
+        y_idx, mask_idx = temporal_idx["y"], temporal_idx["mask"]
         insample_y = windows["temporal"][:, y_idx, :, : -self.h]
         insample_mask = windows["temporal"][:, mask_idx, :, : -self.h]
         outsample_y = windows["temporal"][:, y_idx, :, -self.h :].contiguous()
@@ -258,21 +331,20 @@ class BaseRecurrent(pl.LightningModule):
 
         # Filter historic exogenous variables
         if len(self.hist_exog_list):
-            hist_exog_idx = windows["temporal_cols"].get_indexer(self.hist_exog_list)
-            hist_exog = windows["temporal"][:, hist_exog_idx, :, : -self.h]
+            hist_exog = windows["temporal"][:, temporal_idx["hist_exog"], :, : -self.h]
         else:
             hist_exog = None
 
         # Filter future exogenous variables
         if len(self.futr_exog_list):
-            futr_exog_idx = windows["temporal_cols"].get_indexer(self.futr_exog_list)
-            futr_exog = windows["temporal"][:, futr_exog_idx, :, :]
+            futr_exog = windows["temporal"][:, temporal_idx["futr_exog"], :, :]
         else:
             futr_exog = None
         # Filter static variables
         if len(self.stat_exog_list):
-            static_idx = windows["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = windows["static"][:, static_idx]
+            stat_exog = windows["static"][
+                :, self._static_idx(windows["static_cols"], windows["static"].device)
+            ]
         else:
             stat_exog = None
 
@@ -286,12 +358,72 @@ class BaseRecurrent(pl.LightningModule):
             stat_exog,
         )
 
-    def training_step(self, batch, batch_idx):
-        # Create and normalize windows [Ws, L+H, C]
+    def _left_pad(self, batch, min_size=0):
+        # The recurrent states go through every leading zero of the padding,
+        # series are padded to the same size whatever their batch
+        size = max(self._padded_size or 0, min_size)
+        if batch["temporal"].shape[-1] < size:
+            batch["temporal"] = nn.functional.pad(
+                batch["temporal"], (size - batch["temporal"].shape[-1], 0)
+            )
+        return batch
+
+    def _train_windows(self, batch):
+        # Normalize and create windows [B, C, seq_len, 1+H]
+        batch = self._left_pad(batch)
         batch = self._normalization(
             batch, val_size=self.val_size, test_size=self.test_size
         )
         windows = self._create_windows(batch, step="train")
+        # The scaler statistics travel with windows built by the DataLoader workers
+        windows["x_shift"], windows["x_scale"] = (
+            self.scaler.x_shift,
+            self.scaler.x_scale,
+        )
+        return windows
+
+    def _val_windows(self, batch, batch_idx):
+        # Validation windows are created at every check, the scaler statistics
+        # of their series do not change during the fit and are kept on CPU
+        batch = self._left_pad(batch)
+        stats = self._val_stats_cache.get(batch_idx)
+        if stats is not None:
+            device = batch["temporal"].device
+            batch = dict(
+                batch,
+                x_shift=stats["x_shift"].to(device),
+                x_scale=stats["x_scale"].to(device),
+            )
+        batch = self._normalization(
+            batch, val_size=self.val_size, test_size=self.test_size
+        )
+        if stats is None:
+            self._val_stats_cache[batch_idx] = dict(
+                x_shift=self.scaler.x_shift.cpu(), x_scale=self.scaler.x_scale.cpu()
+            )
+        windows = self._create_windows(batch, step="val")
+        windows["x_shift"], windows["x_scale"] = (
+            self.scaler.x_shift,
+            self.scaler.x_scale,
+        )
+        return windows
+
+    def _val_series(self, dataset):
+        # Fixed random subset of the validated series, drawn once per fit
+        if self.val_series_size is None or self.val_series_size >= dataset.n_groups:
+            return None
+        rng = np.random.default_rng(self.random_seed)
+        return np.sort(
+            rng.choice(dataset.n_groups, size=self.val_series_size, replace=False)
+        )
+
+    def training_step(self, batch, batch_idx):
+        # With windows_in_loader the DataLoader workers already built the windows
+        windows = batch if self.windows_in_loader else self._train_windows(batch)
+        self.scaler.x_shift, self.scaler.x_scale = (
+            windows["x_shift"],
+            windows["x_scale"],
+        )
 
         # Parse windows
         (
@@ -302,7 +434,7 @@ class BaseRecurrent(pl.LightningModule):
             hist_exog,
             futr_exog,
             stat_exog,
-        ) = self._parse_windows(batch, windows)
+        ) = self._parse_windows(windows, windows)
 
         windows_batch = dict(
             insample_y=insample_y,  # [B, seq_len, 1]
@@ -316,7 +448,7 @@ class BaseRecurrent(pl.LightningModule):
         output = self(windows_batch)  # tuple([B, seq_len, H, output])
         if self.loss.is_distribution_output:
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             B = output[0].size()[0]
             T = output[0].size()[1]
@@ -345,11 +477,8 @@ class BaseRecurrent(pl.LightningModule):
         if self.val_size == 0:
             return np.nan
 
-        # Create and normalize windows [Ws, L+H, C]
-        batch = self._normalization(
-            batch, val_size=self.val_size, test_size=self.test_size
-        )
-        windows = self._create_windows(batch, step="val")
+        # Normalized and created windows [B, C, seq_len, 1+H], cached after the first check
+        windows = self._val_windows(batch, batch_idx)
 
         # Parse windows
         (
@@ -360,7 +489,7 @@ class BaseRecurrent(pl.LightningModule):
             hist_exog,
             futr_exog,
             stat_exog,
-        ) = self._parse_windows(batch, windows)
+        ) = self._parse_windows(windows, windows)
 
         windows_batch = dict(
             insample_y=insample_y,  # [B, seq_len, 1]
@@ -381,7 +510,7 @@ class BaseRecurrent(pl.LightningModule):
         if self.loss.is_distribution_output:
             output = [arg[:, -val_windows:-1] for arg in output]
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             B = output[0].size()[0]
             T = output[0].size()[1]
@@ -414,6 +543,9 @@ class BaseRecurrent(pl.LightningModule):
         self.log("ptl/val_loss", avg_loss, batch_size=self.batch_size)
 
     def predict_step(self, batch, batch_idx):
+        # Left pad batches, at least to the test windows
+        batch = self._left_pad(batch, min_size=1 + self.test_size)
+
         # Create and normalize windows [Ws, L+H, C]
         batch = self._normalization(batch, val_size=0, test_size=self.test_size)
         windows = self._create_windows(batch, step="predict")
@@ -493,12 +625,20 @@ class BaseRecurrent(pl.LightningModule):
         `test_size`: int, test size for temporal cross-validation.<br>
         """
         self.val_size = val_size
+        self._reset_columns_idx()
+        self._val_stats_cache = {}
         self.test_size = test_size
+        self._padded_size = getattr(dataset, "max_size", None)
         datamodule = TimeSeriesDataModule(
             dataset,
             batch_size=self.batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            bucket_by_length=self.bucket_by_length_loader,
+            temporal_cols=self._data_cols()[0],
+            static_cols=self._data_cols()[1],
+            train_transform=self._train_windows if self.windows_in_loader else None,
+            val_series=self._val_series(dataset),
         )
 
         ### Check validation every steps ###
@@ -522,6 +662,8 @@ class BaseRecurrent(pl.LightningModule):
 
         trainer = pl.Trainer(**self.trainer_kwargs)
         trainer.fit(self, datamodule=datamodule)
+        # Validation statistics are only reused within the fit
+        self._val_stats_cache = {}
 
     def predict(self, dataset, step_size=1, **data_module_kwargs):
         """Predict.
@@ -536,6 +678,9 @@ class BaseRecurrent(pl.LightningModule):
         if step_size > 1:
             raise Exception("Recurrent models do not support step_size > 1")
 
+        self._reset_columns_idx()
+        self._padded_size = getattr(dataset, "max_size", None)
+
         # fcsts (window, batch, h)
         # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
         pred_trainer_kwargs = self.trainer_kwargs.copy()
@@ -546,6 +691,9 @@ class BaseRecurrent(pl.LightningModule):
 
         trainer = pl.Trainer(**pred_trainer_kwargs)
 
+        data_module_kwargs.setdefault("bucket_by_length", self.bucket_by_length_loader)
+        data_module_kwargs.setdefault("temporal_cols", self._data_cols()[0])
+        data_module_kwargs.setdefault("static_cols", self._data_cols()[1])
         datamodule = TimeSeriesDataModule(
             dataset, num_workers=self.num_workers_loader, **data_module_kwargs
         )
@@ -556,11 +704,14 @@ class BaseRecurrent(pl.LightningModule):
             fcsts = torch.vstack(
                 [fcst[:, -(1 + self.test_size - self.h) :, :] for fcst in fcsts]
             )
-            fcsts = fcsts.numpy().flatten()
-            fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         else:
-            fcsts = torch.vstack([fcst[:, -1:, :] for fcst in fcsts]).numpy().flatten()
-            fcsts = fcsts.reshape(-1, len(self.loss.output_names))
+            fcsts = torch.vstack([fcst[:, -1:, :] for fcst in fcsts])
+        fcsts = fcsts.numpy()
+        if datamodule.bucket_by_length:
+            # Restore the dataset order of the length-bucketed series
+            fcsts = fcsts[np.argsort(datamodule.predict_order())]
+        fcsts = fcsts.flatten()
+        fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
 
     def set_test_size(self, test_size):
@@ -38,6 +38,11 @@ class BaseWindows(pl.LightningModule):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        bucket_by_length_loader=False,
+        windows_in_loader=False,
+        windows_bank=False,
+        val_series_size=None,
+        val_windows_size=None,
         random_seed=1,
         **trainer_kwargs,
     ):
@@ -83,6 +88,7 @@ class BaseWindows(pl.LightningModule):
 
         # Model state
         self.decompose_forecast = False
+        self.sample_windows = False
 
         ## Trainer arguments ##
         # Max steps, validation steps and check_val_every_n_epoch
@@ -124,6 +130,18 @@ class BaseWindows(pl.LightningModule):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.bucket_by_length_loader = bucket_by_length_loader
+        self.windows_in_loader = windows_in_loader
+        self.windows_bank = windows_bank
+
+        # Validation subsets, the scaler statistics of each validation batch are cached
+        self.val_series_size = val_series_size
+        self.val_windows_size = val_windows_size
+        self._val_stats_cache = {}
+
+        # Positions of the model's columns in the batches, see _temporal_idx
+        self._temporal_cols_idx = None
+        self._static_cols_idx = None
 
     def on_fit_start(self):
         torch.manual_seed(self.random_seed)
@@ -148,64 +166,75 @@ class BaseWindows(pl.LightningModule):
         temporal = batch["temporal"]
 
         if step == "train":
+            if self.sample_windows:
+                # TimeSeriesWindowSampler batches are already the sampled windows
+                return batch
+
             if self.val_size + self.test_size > 0:
                 cutoff = -self.val_size - self.test_size
                 temporal = temporal[:, :, :cutoff]
 
-            temporal = self.padder(temporal)
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=self.step_size
+            # Train windows start up to input_size-1 steps before the series
+            # and end up to h steps after them, as if the series were padded
+            # with zeros, batches are only padded to their longest serie
+            B, C, T = temporal.shape
+            device = temporal.device
+            windows_per_serie = (T - 1) // self.step_size + 1
+            starts = torch.arange(windows_per_serie, device=device) * self.step_size - (
+                self.input_size - 1
             )
 
-            # [B, C, Ws, L+H] 0, 1, 2, 3
-            # -> [B * Ws, L+H, C] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
-
-            # Sample and Available conditions
-            available_idx = temporal_cols.get_loc("available_mask")
-            sample_condition = windows[:, -self.h :, available_idx]
-            sample_condition = torch.sum(sample_condition, axis=1)
-            available_condition = windows[:, : -self.h, available_idx]
-            available_condition = torch.sum(available_condition, axis=1)
+            # Sample and Available conditions, from the cumulative sums of the
+            # available_mask row instead of the unfolded windows
+            available_idx = self._temporal_idx(temporal_cols, device)["mask"]
+            available = temporal[:, available_idx, :].to(torch.int32)
+            cumsum = nn.functional.pad(available.cumsum(dim=1), (1, 0))
+            bounds = torch.stack(
+                [starts, starts + self.input_size, starts + window_size]
+            ).clamp(0, T)
+            sums = cumsum[:, bounds]
+            available_condition = sums[:, 1] - sums[:, 0]
+            sample_condition = sums[:, 2] - sums[:, 1]
             final_condition = (sample_condition > 0) & (available_condition > 0)
-            windows = windows[final_condition]
-
-            # Parse Static data to match windows
-            # [B, S_in] -> [B, Ws, S_in] -> [B*Ws, S_in]
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
-                )
-                static = static[final_condition]
+            w_idxs = final_condition.flatten().nonzero().squeeze(-1)
 
             # Protection of empty windows
-            if final_condition.sum() == 0:
+            n_windows = len(w_idxs)
+            if n_windows == 0:
                 raise Exception("No windows available for training")
 
-            # Sample windows
-            n_windows = len(windows)
+            # Sample windows, without replacement when there are enough of them
             if self.windows_batch_size is not None:
-                w_idxs = np.random.choice(
-                    n_windows,
-                    size=self.windows_batch_size,
-                    replace=(n_windows < self.windows_batch_size),
-                )
-                windows = windows[w_idxs]
-
-                if static is not None:
-                    static = static[w_idxs]
+                if n_windows < self.windows_batch_size:
+                    sample = torch.randint(
+                        n_windows, (self.windows_batch_size,), device=device
+                    )
+                else:
+                    sample = torch.randperm(n_windows, device=device)[
+                        : self.windows_batch_size
+                    ]
+                w_idxs = w_idxs[sample]
+
+            # Gather only the sampled windows [Ws, L+H, C], steps outside
+            # of the series are zeros
+            serie_idx = w_idxs // windows_per_serie
+            steps = starts[w_idxs % windows_per_serie, None] + torch.arange(
+                window_size, device=device
+            )
+            inside = (steps >= 0) & (steps < T)
+            windows = temporal[serie_idx[:, None], :, steps.clamp(0, T - 1)]
+            windows = windows.masked_fill(~inside[..., None], 0.0)
 
+            # Windows keep the [B, S_in] static data of the batch and the
+            # index of their serie, _parse_windows gathers their rows
             # think about interaction available * sample mask
             # [B, C, Ws, L+H]
             windows_batch = dict(
                 temporal=windows,
                 temporal_cols=temporal_cols,
-                static=static,
-                static_cols=static_cols,
+                static=batch.get("static", None),
+                static_cols=batch.get("static_cols", None),
+                serie_idx=serie_idx,
             )
             return windows_batch
 
@@ -214,15 +243,23 @@ class BaseWindows(pl.LightningModule):
             if step == "predict":
                 predict_step_size = self.predict_step_size
                 cutoff = -self.input_size - self.test_size
-                temporal = batch["temporal"][:, :, cutoff:]
-
             elif step == "val":
                 predict_step_size = self.step_size
                 cutoff = -self.input_size - self.val_size - self.test_size
+
+            # Left pad batches of series shorter than the windows' span
+            if temporal.shape[-1] < -cutoff:
+                temporal = nn.functional.pad(
+                    temporal, (-cutoff - temporal.shape[-1], 0)
+                )
+
+            if step == "predict":
+                temporal = temporal[:, :, cutoff:]
+            elif step == "val":
                 if self.test_size > 0:
-                    temporal = batch["temporal"][:, :, cutoff : -self.test_size]
+                    temporal = temporal[:, :, cutoff : -self.test_size]
                 else:
-                    temporal = batch["temporal"][:, :, cutoff:]
+                    temporal = temporal[:, :, cutoff:]
 
             if (
                 (step == "predict")
@@ -240,19 +277,15 @@ class BaseWindows(pl.LightningModule):
             windows_per_serie = windows.shape[2]
             windows = windows.permute(0, 2, 3, 1).contiguous()
             windows = windows.reshape(-1, window_size, len(temporal_cols))
-
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
-                )
+            serie_idx = torch.arange(temporal.shape[0], device=temporal.device)
+            serie_idx = serie_idx.repeat_interleave(windows_per_serie)
 
             windows_batch = dict(
                 temporal=windows,
                 temporal_cols=temporal_cols,
-                static=static,
-                static_cols=static_cols,
+                static=batch.get("static", None),
+                static_cols=batch.get("static_cols", None),
+                serie_idx=serie_idx,
             )
             return windows_batch
         else:
@@ -262,22 +295,27 @@ class BaseWindows(pl.LightningModule):
         # windows are already filtered by train/validation/test
         # from the `create_windows_method` nor leakage risk
         temporal = windows["temporal"]  # B, L+H, C
-        temporal_cols = windows["temporal_cols"].copy()  # B, L+H, C
+        temporal_idx = self._temporal_idx(windows["temporal_cols"], temporal.device)
 
         # To avoid leakage uses only the lags
-        temporal_data_cols = temporal_cols.drop("available_mask").tolist()
-        temporal_data = temporal[:, :, temporal_cols.get_indexer(temporal_data_cols)]
-        temporal_mask = temporal[:, :, temporal_cols.get_loc("available_mask")].clone()
+        temporal_data = temporal[:, :, temporal_idx["data"]]
+        temporal_mask = temporal[:, :, temporal_idx["mask"]].clone()
         temporal_mask[:, -self.h :] = 0.0
 
-        # Normalize. self.scaler stores the shift and scale for inverse transform
+        # Normalize. self.scaler stores the shift and scale for inverse transform,
+        # windows of a TimeSeriesWindowBank come with their statistics
         temporal_mask = temporal_mask.unsqueeze(
             -1
         )  # Add channel dimension for scaler.transform.
-        temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
+        temporal_data = self.scaler.transform(
+            x=temporal_data,
+            mask=temporal_mask,
+            x_shift=windows.get("x_shift"),
+            x_scale=windows.get("x_scale"),
+        )
 
         # Replace values in windows dict
-        temporal[:, :, temporal_cols.get_indexer(temporal_data_cols)] = temporal_data
+        temporal[:, :, temporal_idx["data"]] = temporal_data
         windows["temporal"] = temporal
 
         return windows
@@ -293,9 +331,9 @@ class BaseWindows(pl.LightningModule):
         else:
             remove_dimension = False
 
-        temporal_data_cols = temporal_cols.drop("available_mask")
-        y_scale = self.scaler.x_scale[:, :, temporal_data_cols.get_indexer(["y"])]
-        y_shift = self.scaler.x_shift[:, :, temporal_data_cols.get_indexer(["y"])]
+        y_data_idx = self._temporal_idx(temporal_cols, y_hat.device)["y_data"]
+        y_scale = self.scaler.x_scale[:, :, y_data_idx]
+        y_shift = self.scaler.x_shift[:, :, y_data_idx]
 
         y_scale = torch.repeat_interleave(y_scale, repeats=y_hat.shape[-1], dim=-1)
         y_shift = torch.repeat_interleave(y_shift, repeats=y_hat.shape[-1], dim=-1)
@@ -309,10 +347,73 @@ class BaseWindows(pl.LightningModule):
 
         return y_hat, y_shift, y_scale
 
+    def _temporal_idx(self, temporal_cols, device=None):
+        # Positions of the model's temporal columns in the batches, resolved on
+        # the first step of each fit or predict and reused while the columns match.
+        # They are copied to the batches' device once, not on every step
+        cached = self._temporal_cols_idx
+        if cached is None or not (
+            cached[0] is temporal_cols or cached[0].equals(temporal_cols)
+        ):
+            data_cols = temporal_cols.drop("available_mask")
+            idx = dict(
+                data=torch.as_tensor(temporal_cols.get_indexer(data_cols)),
+                y_data=torch.as_tensor(data_cols.get_indexer(["y"])),
+                y=temporal_cols.get_loc("y"),
+                mask=temporal_cols.get_loc("available_mask"),
+                hist_exog=torch.as_tensor(
+                    temporal_cols.get_indexer(self.hist_exog_list)
+                ),
+                futr_exog=torch.as_tensor(
+                    temporal_cols.get_indexer(self.futr_exog_list)
+                ),
+            )
+            cached = self._temporal_cols_idx = (temporal_cols, {None: idx})
+        if device not in cached[1]:
+            cached[1][device] = {
+                name: value.to(device) if torch.is_tensor(value) else value
+                for name, value in cached[1][None].items()
+            }
+        return cached[1][device]
+
+    def _static_idx(self, static_cols, device=None):
+        # Positions of the model's static columns in the batches, on their device
+        cached = self._static_cols_idx
+        if cached is None or not (
+            cached[0] is static_cols or cached[0].equals(static_cols)
+        ):
+            idx = torch.as_tensor(static_cols.get_indexer(self.stat_exog_list))
+            cached = self._static_cols_idx = (static_cols, {None: idx})
+        if device not in cached[1]:
+            cached[1][device] = cached[1][None].to(device)
+        return cached[1][device]
+
+    def _windows_static(self, windows):
+        # [Ws, S] static exogenous of the windows, only the model's columns of
+        # the series' static rows are gathered with the windows' serie index
+        stat_exog = windows["static"][
+            :, self._static_idx(windows["static_cols"], windows["static"].device)
+        ]
+        if windows.get("serie_idx") is not None:
+            stat_exog = stat_exog[windows["serie_idx"]]
+        return stat_exog
+
+    def _reset_columns_idx(self):
+        # Batches of a new fit or predict can come with other columns
+        self._temporal_cols_idx = None
+        self._static_cols_idx = None
+
+    def _data_cols(self):
+        # Columns read by the model, TimeSeriesDataModule only yields these
+        temporal_cols = ["y"] + self.hist_exog_list + self.futr_exog_list
+        return list(dict.fromkeys(temporal_cols)), self.stat_exog_list
+
     def _parse_windows(self, batch, windows):
         # Filter insample lags from outsample horizon
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        temporal_idx = self._temporal_idx(
+            windows["temporal_cols"], windows["temporal"].device
+        )
+        y_idx, mask_idx = temporal_idx["y"], temporal_idx["mask"]
         insample_y = windows["temporal"][:, : -self.h, y_idx]
         insample_mask = windows["temporal"][:, : -self.h, mask_idx]
         outsample_y = windows["temporal"][:, -self.h :, y_idx]
@@ -320,21 +421,18 @@ class BaseWindows(pl.LightningModule):
 
         # Filter historic exogenous variables
         if len(self.hist_exog_list):
-            hist_exog_idx = windows["temporal_cols"].get_indexer(self.hist_exog_list)
-            hist_exog = windows["temporal"][:, : -self.h, hist_exog_idx]
+            hist_exog = windows["temporal"][:, : -self.h, temporal_idx["hist_exog"]]
         else:
             hist_exog = None
 
         # Filter future exogenous variables
         if len(self.futr_exog_list):
-            futr_exog_idx = windows["temporal_cols"].get_indexer(self.futr_exog_list)
-            futr_exog = windows["temporal"][:, :, futr_exog_idx]
+            futr_exog = windows["temporal"][:, :, temporal_idx["futr_exog"]]
         else:
             futr_exog = None
         # Filter static variables
         if len(self.stat_exog_list):
-            static_idx = windows["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = windows["static"][:, static_idx]
+            stat_exog = self._windows_static(windows)
         else:
             stat_exog = None
 
@@ -348,10 +446,78 @@ class BaseWindows(pl.LightningModule):
             stat_exog,
         )
 
-    def training_step(self, batch, batch_idx):
+    def _train_windows(self, batch):
         # Create and normalize windows [Ws, L+H, C]
         windows = self._create_windows(batch, step="train")
         windows = self._normalization(windows=windows)
+        # The scaler statistics travel with windows built by the DataLoader workers
+        windows["x_shift"], windows["x_scale"] = (
+            self.scaler.x_shift,
+            self.scaler.x_scale,
+        )
+        return windows
+
+    def _val_windows(self, batch, batch_idx):
+        # Validation windows are created at every check, their subset and
+        # scaler statistics do not change during the fit and are kept on CPU
+        windows = self._create_windows(batch, step="val")
+        device = windows["temporal"].device
+        stats = self._val_stats_cache.get(batch_idx)
+        if stats is None:
+            sample = None
+            n_windows = len(windows["temporal"])
+            if self.val_windows_size is not None and n_windows > self.val_windows_size:
+                # Fixed random subset of the windows, the global RNG is left untouched
+                generator = torch.Generator().manual_seed(self.random_seed + batch_idx)
+                sample = (
+                    torch.randperm(n_windows, generator=generator)[
+                        : self.val_windows_size
+                    ]
+                    .sort()
+                    .values
+                )
+            stats = dict(sample=sample)
+        else:
+            windows["x_shift"], windows["x_scale"] = stats["x_shift"].to(device), stats[
+                "x_scale"
+            ].to(device)
+        if stats["sample"] is not None:
+            sample = stats["sample"].to(device)
+            windows["temporal"] = windows["temporal"][sample]
+            windows["serie_idx"] = windows["serie_idx"][sample]
+        windows = self._normalization(windows=windows)
+        windows["x_shift"], windows["x_scale"] = (
+            self.scaler.x_shift,
+            self.scaler.x_scale,
+        )
+        if batch_idx not in self._val_stats_cache:
+            self._val_stats_cache[batch_idx] = dict(
+                sample=stats["sample"],
+                x_shift=self.scaler.x_shift.cpu(),
+                x_scale=self.scaler.x_scale.cpu(),
+            )
+        return windows
+
+    def _val_series(self, dataset):
+        # Fixed random subset of the validated series, drawn once per fit
+        if self.val_series_size is None or self.val_series_size >= dataset.n_groups:
+            return None
+        rng = np.random.default_rng(self.random_seed)
+        return np.sort(
+            rng.choice(dataset.n_groups, size=self.val_series_size, replace=False)
+        )
+
+    def _loader_windows(self):
+        # The train loader yields windows already created and normalized
+        return self.windows_in_loader or self.windows_bank
+
+    def training_step(self, batch, batch_idx):
+        # With windows_in_loader or windows_bank the windows are already built
+        windows = batch if self._loader_windows() else self._train_windows(batch)
+        self.scaler.x_shift, self.scaler.x_scale = (
+            windows["x_shift"],
+            windows["x_scale"],
+        )
 
         # Parse windows
         (
@@ -362,7 +528,7 @@ class BaseWindows(pl.LightningModule):
             hist_exog,
             futr_exog,
             stat_exog,
-        ) = self._parse_windows(batch, windows)
+        ) = self._parse_windows(windows, windows)
 
         windows_batch = dict(
             insample_y=insample_y,  # [Ws, L]
@@ -376,7 +542,7 @@ class BaseWindows(pl.LightningModule):
         output = self(windows_batch)
         if self.loss.is_distribution_output:
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             loss = self.loss(
                 y=outsample_y,
@@ -396,9 +562,8 @@ class BaseWindows(pl.LightningModule):
         if self.val_size == 0:
             return np.nan
 
-        # Create and normalize windows [Ws, L+H, C]
-        windows = self._create_windows(batch, step="val")
-        windows = self._normalization(windows=windows)
+        # Created and normalized windows [Ws, L+H, C], cached after the first check
+        windows = self._val_windows(batch, batch_idx)
 
         # Parse windows
         (
@@ -423,7 +588,7 @@ class BaseWindows(pl.LightningModule):
         output = self(windows_batch)
         if self.loss.is_distribution_output:
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             loss = self.loss(
                 y=outsample_y,
@@ -516,13 +681,30 @@ class BaseWindows(pl.LightningModule):
         `test_size`: int, test size for temporal cross-validation.<br>
         """
         self.val_size = val_size
+        self._reset_columns_idx()
+        self._val_stats_cache = {}
         self.test_size = test_size
         datamodule = TimeSeriesDataModule(
             dataset,
             batch_size=self.batch_size,
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
+            bucket_by_length=self.bucket_by_length_loader,
+            temporal_cols=self._data_cols()[0],
+            static_cols=self._data_cols()[1],
+            train_transform=self._train_windows if self._loader_windows() else None,
+            windows_bank=self.windows_bank,
+            val_series=self._val_series(dataset),
+            windows=dict(
+                input_size=self.input_size,
+                h=self.h,
+                step_size=self.step_size,
+                cutoff=self.val_size + self.test_size,
+            ),
+            windows_batch_size=self.windows_batch_size,
         )
+        # Streaming datasets unfold the windows of each batch of series
+        self.sample_windows = datamodule.sample_windows
 
         ### Check validation every steps ###
         steps_in_epoch = np.ceil(dataset.n_groups / self.batch_size)
@@ -545,6 +727,8 @@ class BaseWindows(pl.LightningModule):
 
         trainer = pl.Trainer(**self.trainer_kwargs)
         trainer.fit(self, datamodule=datamodule)
+        # Validation statistics are only reused within the fit
+        self._val_stats_cache = {}
 
     def predict(self, dataset, test_size=None, step_size=1, **data_module_kwargs):
         """Predict.
@@ -558,7 +742,13 @@ class BaseWindows(pl.LightningModule):
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self.predict_step_size = step_size
+        self._reset_columns_idx()
         self.decompose_forecast = False
+        data_module_kwargs.setdefault("bucket_by_length", self.bucket_by_length_loader)
+        data_module_kwargs.setdefault("temporal_cols", self._data_cols()[0])
+        data_module_kwargs.setdefault("static_cols", self._data_cols()[1])
+        # Predict windows only span the last input_size + test_size steps
+        data_module_kwargs.setdefault("tail_size", self.input_size + self.test_size)
         datamodule = TimeSeriesDataModule(dataset, **data_module_kwargs)
 
         # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
@@ -570,7 +760,12 @@ class BaseWindows(pl.LightningModule):
 
         trainer = pl.Trainer(**pred_trainer_kwargs)
         fcsts = trainer.predict(self, datamodule=datamodule)
-        fcsts = torch.vstack(fcsts).numpy().flatten()
+        fcsts = torch.vstack(fcsts).numpy()
+        if datamodule.bucket_by_length:
+            # Restore the dataset order of the length-bucketed series
+            fcsts = fcsts.reshape(dataset.n_groups, -1)
+            fcsts = fcsts[np.argsort(datamodule.predict_order())]
+        fcsts = fcsts.flatten()
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
 
@@ -586,7 +781,12 @@ class BaseWindows(pl.LightningModule):
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self.predict_step_size = step_size
+        self._reset_columns_idx()
         self.decompose_forecast = True
+        data_module_kwargs.setdefault("temporal_cols", self._data_cols()[0])
+        data_module_kwargs.setdefault("static_cols", self._data_cols()[1])
+        # Predict windows only span the last input_size + test_size steps
+        data_module_kwargs.setdefault("tail_size", self.input_size + self.test_size)
         datamodule = TimeSeriesDataModule(dataset, **data_module_kwargs)
         trainer = pl.Trainer(**self.trainer_kwargs)
         fcsts = trainer.predict(self, datamodule=datamodule)
@@ -333,7 +333,7 @@ class TemporalNorm(nn.Module):
         self.eps = eps
 
     # @torch.no_grad()
-    def transform(self, x, mask):
+    def transform(self, x, mask, x_shift=None, x_scale=None):
         """Center and scale the data.
 
         **Parameters:**<br>
@@ -341,11 +341,23 @@ class TemporalNorm(nn.Module):
         `mask`: torch Tensor bool, shape  [batch, time] where `x` is valid and False
                 where `x` should be masked. Mask should not be all False in any column of
                 dimension dim to avoid NaNs from zero division.<br>
+        `x_shift`: torch.Tensor, optional, shift computed before, `x` is scaled with it.<br>
+        `x_scale`: torch.Tensor, optional, scale computed before, `x` is scaled with it.<br>
 
         **Returns:**<br>
         `z`: torch.Tensor same shape as `x`, except scaled.
         """
-        z, x_shift, x_scale = self.scaler(x=x, mask=mask, dim=self.dim, eps=self.eps)
+        if x_shift is None or x_scale is None:
+            z, x_shift, x_scale = self.scaler(
+                x=x, mask=mask, dim=self.dim, eps=self.eps
+            )
+        else:
+            # Same scaling as the scalers, with their statistics given
+            z = (x - x_shift) / x_scale
+            if self.scaler_type == "minmax1":
+                z = z * 2 - 1
+            elif self.scaler_type == "invariant":
+                z = torch.arcsinh(z)
         self.x_shift = x_shift
         self.x_scale = x_scale
         return z
@@ -4,13 +4,16 @@
 __all__ = ['NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
+import hashlib
 import os
 import pickle
+from collections import OrderedDict
 from os.path import isfile, join
 from typing import Any, List, Optional
 
 import numpy as np
 import pandas as pd
+import torch
 
 from .tsdataset import TimeSeriesDataset
 from neuralforecast.models import (
@@ -65,7 +68,83 @@ def _cv_dates(last_dates, freq, h, test_size, step_size=1):
         dates = dates.reset_index(drop=True)
     return dates
 
-# %% ../nbs/core.ipynb 9
+# %% ../nbs/core.ipynb 6
+def _fingerprint(df, n_rows=10_000):
+    # Hash of a pandas or polars DataFrame or a pyarrow Table, its shape and the
+    # names, dtypes and values of every column of `n_rows` evenly spaced rows,
+    # including the first and last ones, are streamed through blake2b
+    if df is None:
+        return None
+    if type(df).__module__.split(".")[0] == "polars":
+        df = df.to_arrow()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((type(df).__name__, df.shape)).encode())
+    if len(df) > n_rows:
+        rows = np.linspace(0, len(df) - 1, n_rows).astype(np.int64)
+        df = df.iloc[rows] if isinstance(df, pd.DataFrame) else df.take(rows)
+    if isinstance(df, pd.DataFrame):
+        columns = [df.index] if df.index.name == "unique_id" else []
+        columns += [df[col] for col in df.columns]
+        for col in columns:
+            h.update(f"{col.name}:{col.dtype}".encode())
+            values = col.to_numpy()
+            if values.dtype == object:
+                values = pd.util.hash_array(values)
+            h.update(np.ascontiguousarray(values).view(np.uint8))
+    else:
+        for name, col in zip(df.column_names, df.columns):
+            h.update(f"{name}:{col.type}".encode())
+            for chunk in col.chunks:
+                h.update(repr((chunk.offset, len(chunk))).encode())
+                buffers = chunk.buffers()
+                if hasattr(chunk, "dictionary"):
+                    buffers += chunk.dictionary.buffers()
+                for buf in buffers:
+                    if buf is not None:
+                        h.update(buf)
+    return h.hexdigest()
+
+
+def _dataset_nbytes(dataset):
+    # Memory held by the temporal and static blocks and the stored ds of a dataset
+    temporal = dataset.temporal
+    nbytes = (
+        temporal.numel() * temporal.element_size()
+        if torch.is_tensor(temporal)
+        else temporal.nbytes
+    )
+    if dataset.static is not None:
+        nbytes += dataset.static.numel() * dataset.static.element_size()
+    if dataset._ds is not None:
+        nbytes += dataset._ds.nbytes
+    return nbytes
+
+
+class _LRUCache:
+    # Mapping bounded by the bytes of its values, evicts the least recently
+    # used entries, values larger than the bound are not kept
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.data = OrderedDict()
+
+    def get(self, key):
+        if key not in self.data:
+            return None
+        self.data.move_to_end(key)
+        return self.data[key][0]
+
+    def put(self, key, value, nbytes):
+        if key in self.data:
+            self.nbytes -= self.data.pop(key)[1]
+        if nbytes > self.max_bytes:
+            return
+        self.data[key] = (value, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            self.nbytes -= self.data.popitem(last=False)[1][1]
+
+# %% ../nbs/core.ipynb 10
 MODEL_FILENAME_DICT = {
     "gru": GRU,
     "lstm": LSTM,
@@ -87,9 +166,9 @@ MODEL_FILENAME_DICT = {
     "autonhits": NHITS,
 }
 
-# %% ../nbs/core.ipynb 10
+# %% ../nbs/core.ipynb 11
 class NeuralForecast:
-    def __init__(self, models: List[Any], freq: str):
+    def __init__(self, models: List[Any], freq: str, dataset_cache_bytes: int = 0):
         """
         The `core.StatsForecast` class allows you to efficiently fit multiple `NeuralForecast` models
         for large sets of time series. It operates with pandas DataFrame `df` that identifies series
@@ -104,6 +183,10 @@ class NeuralForecast:
         freq : str
             Frequency of the data,
             see [panda's available frequencies](https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases).
+        dataset_cache_bytes : int (default=0)
+            Memory of the datasets built by `fit`, `predict` and `cross_validation` kept
+            to be reused when they get the same inputs. Inputs are matched by a hash
+            of sampled rows, in place edits of other rows go unnoticed. 0 disables it.
 
         Returns
         -------
@@ -121,13 +204,48 @@ class NeuralForecast:
         # Flags and attributes
         self._fitted = False
 
-    def _prepare_fit(self, df, static_df, sort_df):
-        # TODO: uids, last_dates and ds should be properties of the dataset class. See github issue.
-        self.dataset, self.uids, self.last_dates, self.ds = TimeSeriesDataset.from_df(
-            df=df, static_df=static_df, sort_df=sort_df
-        )
+        # Datasets built from previous inputs, reused while their fingerprints match
+        self._datasets = _LRUCache(max_bytes=dataset_cache_bytes)
+
+    def _prepare_fit(self, df, static_df, sort_df, dtype=torch.float32, sparse=False):
+        # TODO: uids and last_dates should be properties of the dataset class. See github issue.
+        # A dict of per-column dtypes is made hashable for the cache key
+        dtype_key = tuple(dtype.items()) if isinstance(dtype, dict) else dtype
+        prepared = None
+        if self._datasets.max_bytes:
+            key = (
+                "df",
+                _fingerprint(df),
+                _fingerprint(static_df),
+                sort_df,
+                dtype_key,
+                sparse,
+            )
+            prepared = self._datasets.get(key)
+        if prepared is None:
+            # The ds of every row are not kept, the dataset rebuilds them from
+            # the first date, size and freq of each serie
+            prepared = TimeSeriesDataset.from_df(
+                df=df,
+                static_df=static_df,
+                sort_df=sort_df,
+                dtype=dtype,
+                sparse=sparse,
+                freq=self.freq,
+            )[:3]
+            if self._datasets.max_bytes:
+                self._datasets.put(key, prepared, _dataset_nbytes(prepared[0]))
+        self.dataset, self.uids, self.last_dates = prepared
         self.sort_df = sort_df
 
+    @property
+    def ds(self):
+        """(`unique_id`, `ds`) index of the stored dataset, rebuilt on each access."""
+        sizes = np.diff(self.dataset.indptr)
+        return pd.MultiIndex.from_arrays(
+            [self.uids.repeat(sizes), self.dataset.ds], names=["unique_id", "ds"]
+        )
+
     def fit(
         self,
         df: Optional[pd.DataFrame] = None,
@@ -135,6 +253,8 @@ class NeuralForecast:
         val_size: Optional[int] = 0,
         sort_df: bool = True,
         verbose: bool = False,
+        dtype: torch.dtype = torch.float32,
+        sparse: bool = False,
     ):
         """Fit the core.NeuralForecast.
 
@@ -143,10 +263,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`] and static exogenous.
         val_size : int, optional (default=0)
             Size of validation set.
@@ -154,6 +274,11 @@ class NeuralForecast:
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
+        dtype : torch.dtype or dict (default=torch.float32)
+            Storage dtype of the temporal data, `torch.float16` or `torch.bfloat16` halve its memory.
+            A dict sets the dtype of some temporal columns, the others stay float32.
+        sparse : bool (default=False)
+            Store only the nonzero temporal values, for intermittent series mostly made of zeros.
 
         Returns
         -------
@@ -165,7 +290,9 @@ class NeuralForecast:
 
         # Process and save new dataset (in self)
         if df is not None:
-            self._prepare_fit(df=df, static_df=static_df, sort_df=sort_df)
+            self._prepare_fit(
+                df=df, static_df=static_df, sort_df=sort_df, dtype=dtype, sparse=sparse
+            )
         else:
             if verbose:
                 print("Using stored dataset.")
@@ -177,6 +304,35 @@ class NeuralForecast:
 
         self._fitted = True
 
+    def append(self, df: pd.DataFrame):
+        """Append new observations to the stored dataset.
+
+        Extends the stored series with the rows of `df` without processing
+        the stored history again, and moves `last_dates` forward, so the next
+        `predict` forecasts from the new observations.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables,
+            with observations after the last date of each serie.
+            Series not in the stored dataset are added after the others.
+        """
+        if not hasattr(self, "dataset"):
+            raise Exception("You must have a stored dataset to append observations.")
+
+        self.dataset, self.uids, self.last_dates = TimeSeriesDataset.append(
+            dataset=self.dataset, df=df, indices=self.uids, dates=self.last_dates
+        )
+
+    def _uids_index(self, repeats):
+        # Categorical unique_id with `repeats` rows per serie, built from the
+        # series' integer codes instead of repeating the original ids
+        codes = np.repeat(np.arange(len(self.uids)), repeats)
+        return pd.CategoricalIndex(
+            pd.Categorical.from_codes(codes, categories=self.uids), name="unique_id"
+        )
+
     def _make_future_df(self, h: int):
         if issubclass(self.last_dates.dtype.type, np.integer):
             last_date_f = lambda x: np.arange(
@@ -190,7 +346,7 @@ class NeuralForecast:
             dates = np.tile(last_date_f(self.last_dates[0]), len(self.dataset))
         else:
             dates = np.hstack([last_date_f(last_date) for last_date in self.last_dates])
-        idx = pd.Index(np.repeat(self.uids, h), name="unique_id")
+        idx = self._uids_index(repeats=h)
         df = pd.DataFrame({"ds": dates}, index=idx)
         return df
 
@@ -201,6 +357,8 @@ class NeuralForecast:
         futr_df: Optional[pd.DataFrame] = None,
         sort_df: bool = True,
         verbose: bool = False,
+        dtype: torch.dtype = torch.float32,
+        sparse: bool = False,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -209,17 +367,22 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If a DataFrame is passed, it is used to generate forecasts.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`] and static exogenous.
-        futr_df : pandas.DataFrame, optional (default=None)
+        futr_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
         sort_df : bool (default=True)
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
+        dtype : torch.dtype or dict (default=torch.float32)
+            Storage dtype of the temporal data, `torch.float16` or `torch.bfloat16` halve its memory.
+            A dict sets the dtype of some temporal columns, the others stay float32.
+        sparse : bool (default=False)
+            Store only the nonzero temporal values, for intermittent series mostly made of zeros.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -234,7 +397,9 @@ class NeuralForecast:
 
         # Process and save new dataset (in self)
         if df is not None:
-            self._prepare_fit(df=df, static_df=static_df, sort_df=sort_df)
+            self._prepare_fit(
+                df=df, static_df=static_df, sort_df=sort_df, dtype=dtype, sparse=sparse
+            )
         else:
             if verbose:
                 print("Using stored dataset.")
@@ -251,15 +416,23 @@ class NeuralForecast:
         # Placeholder dataframe for predictions with unique_id and ds
         fcsts_df = self._make_future_df(h=self.h)
 
-        # Update and define new forecasting dataset
-        if futr_df is not None:
-            dataset = TimeSeriesDataset.update_dataset(
-                dataset=self.dataset, future_df=futr_df
-            )
+        # Update and define new forecasting dataset, unless it was built for the same data
+        updated = None
+        if self._datasets.max_bytes:
+            key = ("futr_df", id(self.dataset), _fingerprint(futr_df))
+            updated = self._datasets.get(key)
+        if updated is not None and updated[0] is self.dataset:
+            dataset = updated[1]
         else:
+            if futr_df is None:
+                futr_df = fcsts_df.reset_index()
             dataset = TimeSeriesDataset.update_dataset(
-                dataset=self.dataset, future_df=fcsts_df.reset_index()
+                dataset=self.dataset, future_df=futr_df, indices=self.uids
             )
+            if self._datasets.max_bytes:
+                self._datasets.put(
+                    key, (self.dataset, dataset), _dataset_nbytes(dataset)
+                )
 
         col_idx = 0
         fcsts = np.full((self.h * len(self.uids), len(cols)), fill_value=np.nan)
@@ -287,6 +460,8 @@ class NeuralForecast:
         test_size: Optional[int] = None,
         sort_df: bool = True,
         verbose: bool = False,
+        dtype: torch.dtype = torch.float32,
+        sparse: bool = False,
         **data_kwargs,
     ):
         """Temporal Cross-Validation with core.NeuralForecast.
@@ -296,10 +471,10 @@ class NeuralForecast:
 
         Parameters
         ----------
-        df : pandas.DataFrame, optional (default=None)
+        df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
             If None, a previously stored dataset is required.
-        static_df : pandas.DataFrame, optional (default=None)
+        static_df : pandas.DataFrame, polars.DataFrame or pyarrow.Table, optional (default=None)
             DataFrame with columns [`unique_id`, `ds`] and static exogenous.
         n_windows : int (default=1)
             Number of windows used for cross validation.
@@ -313,6 +488,11 @@ class NeuralForecast:
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
+        dtype : torch.dtype or dict (default=torch.float32)
+            Storage dtype of the temporal data, `torch.float16` or `torch.bfloat16` halve its memory.
+            A dict sets the dtype of some temporal columns, the others stay float32.
+        sparse : bool (default=False)
+            Store only the nonzero temporal values, for intermittent series mostly made of zeros.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -327,7 +507,9 @@ class NeuralForecast:
 
         # Declare predictions pd.DataFrame
         if df is not None:
-            self._prepare_fit(df=df, static_df=static_df, sort_df=sort_df)
+            self._prepare_fit(
+                df=df, static_df=static_df, sort_df=sort_df, dtype=dtype, sparse=sparse
+            )
         else:
             if verbose:
                 print("Using stored dataset.")
@@ -360,7 +542,7 @@ class NeuralForecast:
             test_size=test_size,
             step_size=step_size,
         )
-        idx = pd.Index(np.repeat(self.uids, h * n_windows), name="unique_id")
+        idx = self._uids_index(repeats=h * n_windows)
         fcsts_df.index = idx
 
         col_idx = 0
@@ -383,6 +565,12 @@ class NeuralForecast:
         fcsts_df = pd.concat([fcsts_df, fcsts], axis=1)
 
         # Add original input df's y to forecasts DataFrame
+        if not isinstance(df, pd.DataFrame):
+            df = df.to_pandas()
+        if "unique_id" not in df.columns:
+            df = df.reset_index()
+        # Keys sharing the forecasts' categories are merged on their integer codes
+        df = df.assign(unique_id=pd.Categorical(df["unique_id"], categories=self.uids))
         fcsts_df = fcsts_df.merge(df, how="left", on=["unique_id", "ds"])
         return fcsts_df
 
@@ -444,8 +632,7 @@ class NeuralForecast:
 
         # Save dataset
         if (save_dataset) and (hasattr(self, "dataset")):
-            with open(f"{path}/dataset.pkl", "wb") as f:
-                pickle.dump(self.dataset, f)
+            self.dataset.save(f"{path}/dataset")
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
@@ -458,7 +645,6 @@ class NeuralForecast:
             "freq": self.freq,
             "uids": self.uids,
             "last_dates": self.last_dates,
-            "ds": self.ds,
             "sort_df": self.sort_df,
             "_fitted": self._fitted,
         }
@@ -503,7 +689,12 @@ class NeuralForecast:
         if verbose:
             print(10 * "-" + " Loading dataset " + 10 * "-")
         # Load dataset
-        if "dataset.pkl" in files:
+        if os.path.isdir(f"{path}/dataset"):
+            dataset = TimeSeriesDataset.load(f"{path}/dataset")
+            if verbose:
+                print("Dataset loaded.")
+        elif "dataset.pkl" in files:
+            # Datasets pickled by previous versions
             with open(f"{path}/dataset.pkl", "rb") as f:
                 dataset = pickle.load(f)
             if verbose:
@@ -532,8 +723,16 @@ class NeuralForecast:
             neuralforecast.dataset = dataset
             neuralforecast.uids = config_dict["uids"]
             neuralforecast.last_dates = config_dict["last_dates"]
-            neuralforecast.ds = config_dict["ds"]
             neuralforecast.sort_df = config_dict["sort_df"]
+            # Configurations saved by previous versions keep the full ds
+            if dataset.freq is None:
+                dataset.freq = neuralforecast.freq
+            if dataset.first_ds is None and "ds" in config_dict:
+                ds = config_dict["ds"].get_level_values("ds").to_numpy()
+                dataset.first_ds = ds[dataset.indptr[:-1]]
+                dataset.last_ds = np.asarray(config_dict["last_dates"])
+                if not dataset._regular():
+                    dataset._ds = ds
 
         # Fitted flag
         neuralforecast._fitted = config_dict["_fitted"]
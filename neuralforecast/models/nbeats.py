@@ -223,6 +223,11 @@ class NBEATS(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `bucket_by_length_loader`: bool=False, if True `TimeSeriesDataLoader` batches together series of similar length.<br>
+    `windows_in_loader`: bool=False, if True the DataLoader workers create and normalize the training windows.<br>
+    `windows_bank`: bool=False, if True the scaler statistics of every training window are computed once before training, for panels that fit in memory.<br>
+    `val_series_size`: int=None, size of a fixed random subset of series evaluated by the validation checks, None uses every serie.<br>
+    `val_windows_size`: int=None, size of a fixed random subset of windows evaluated in each validation batch, None uses every window.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
     **References:**<br>
@@ -255,6 +260,11 @@ class NBEATS(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        bucket_by_length_loader: bool = False,
+        windows_in_loader: bool = False,
+        windows_bank: bool = False,
+        val_series_size: int = None,
+        val_windows_size: int = None,
         **trainer_kwargs,
     ):
 
@@ -273,6 +283,11 @@ class NBEATS(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            bucket_by_length_loader=bucket_by_length_loader,
+            windows_in_loader=windows_in_loader,
+            windows_bank=windows_bank,
+            val_series_size=val_series_size,
+            val_windows_size=val_windows_size,
             random_seed=random_seed,
             **trainer_kwargs,
         )
@@ -414,6 +414,11 @@ class TFT(BaseWindows):
     `random_seed`: int, random seed initialization for replicability.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `bucket_by_length_loader`: bool=False, if True `TimeSeriesDataLoader` batches together series of similar length.<br>
+    `windows_in_loader`: bool=False, if True the DataLoader workers create and normalize the training windows.<br>
+    `windows_bank`: bool=False, if True the scaler statistics of every training window are computed once before training, for panels that fit in memory.<br>
+    `val_series_size`: int=None, size of a fixed random subset of series evaluated by the validation checks, None uses every serie.<br>
+    `val_windows_size`: int=None, size of a fixed random subset of windows evaluated in each validation batch, None uses every window.<br>
     `**trainer_kwargs`: int,  keyword trainer arguments inherited from [PyTorch Lighning's trainer](https://pytorch-lightning.readthedocs.io/en/stable/api/pytorch_lightning.trainer.trainer.Trainer.html?highlight=trainer).<br>
 
     **References:**<br>
@@ -445,6 +450,11 @@ class TFT(BaseWindows):
         scaler_type: str = "robust",
         num_workers_loader=0,
         drop_last_loader=False,
+        bucket_by_length_loader=False,
+        windows_in_loader=False,
+        windows_bank=False,
+        val_series_size=None,
+        val_windows_size=None,
         random_seed: int = 1,
         **trainer_kwargs
     ):
@@ -465,6 +475,11 @@ class TFT(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            bucket_by_length_loader=bucket_by_length_loader,
+            windows_in_loader=windows_in_loader,
+            windows_bank=windows_bank,
+            val_series_size=val_series_size,
+            val_windows_size=val_windows_size,
             random_seed=random_seed,
             **trainer_kwargs
         )
@@ -519,30 +534,26 @@ class TFT(BaseWindows):
     def forward(self, x):
 
         # Extract static and temporal features
-        y_idx = x["temporal_cols"].get_loc("y")
+        temporal_idx = self._temporal_idx(x["temporal_cols"], x["temporal"].device)
+        y_idx = temporal_idx["y"]
         y_insample = x["temporal"][:, :, y_idx, None]
 
         # Historic variables
         if len(self.hist_exog_list) > 0:
-            hist_exog = x["temporal"][
-                :, :, x["temporal_cols"].get_indexer(self.hist_exog_list)
-            ]
+            hist_exog = x["temporal"][:, :, temporal_idx["hist_exog"]]
         else:
             hist_exog = None
 
         # Future variables
         if len(self.futr_exog_list) > 0:
-            futr_exog = x["temporal"][
-                :, :, x["temporal_cols"].get_indexer(self.futr_exog_list)
-            ]
+            futr_exog = x["temporal"][:, :, temporal_idx["futr_exog"]]
         else:
             futr_exog = x["temporal"][:, [-self.h - 1], y_idx]
             futr_exog = futr_exog[:, :, None].repeat(1, self.example_length, 1)
 
         # Static variables
         if len(self.stat_exog_list) > 0:
-            static_idx = x["static_cols"].get_indexer(self.stat_exog_list)
-            stat_exog = x["static"][:, static_idx]
+            stat_exog = self._windows_static(x)
         else:
             stat_exog = None
 
@@ -604,13 +615,18 @@ class TFT(BaseWindows):
         # allow the model to receive future exogenous available
         # at the time of the prediction.
 
-        # Create and normalize windows [Ws, L+H, C]
-        windows = self._create_windows(batch, step="train")
-        windows = self._normalization(windows=windows)
+        # Create and normalize windows [Ws, L+H, C], unless the loader already did
+        windows = batch if self._loader_windows() else self._train_windows(batch)
+        self.scaler.x_shift, self.scaler.x_scale = (
+            windows["x_shift"],
+            windows["x_scale"],
+        )
 
         # Parse outsample data
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        temporal_idx = self._temporal_idx(
+            windows["temporal_cols"], windows["temporal"].device
+        )
+        y_idx, mask_idx = temporal_idx["y"], temporal_idx["mask"]
         outsample_y = windows["temporal"][:, -self.h :, y_idx]
         outsample_mask = windows["temporal"][:, -self.h :, mask_idx]
 
@@ -618,7 +634,7 @@ class TFT(BaseWindows):
         output = self(x=windows)
         if self.loss.is_distribution_output:
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             loss = self.loss(
                 y=outsample_y,
@@ -641,13 +657,14 @@ class TFT(BaseWindows):
         if self.val_size == 0:
             return np.nan
 
-        # Create and normalize windows [Ws, L+H, C]
-        windows = self._create_windows(batch, step="val")
-        windows = self._normalization(windows=windows)
+        # Created and normalized windows [Ws, L+H, C], cached after the first check
+        windows = self._val_windows(batch, batch_idx)
 
         # Parse outsample data
-        y_idx = batch["temporal_cols"].get_loc("y")
-        mask_idx = batch["temporal_cols"].get_loc("available_mask")
+        temporal_idx = self._temporal_idx(
+            windows["temporal_cols"], windows["temporal"].device
+        )
+        y_idx, mask_idx = temporal_idx["y"], temporal_idx["mask"]
         outsample_y = windows["temporal"][:, -self.h :, y_idx]
         outsample_mask = windows["temporal"][:, -self.h :, mask_idx]
 
@@ -655,7 +672,7 @@ class TFT(BaseWindows):
         output = self(x=windows)
         if self.loss.is_distribution_output:
             outsample_y, y_shift, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"]
+                y_hat=outsample_y, temporal_cols=windows["temporal_cols"]
             )
             loss = self.loss(
                 y=outsample_y,
@@ -1,18 +1,579 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/tsdataset.ipynb.
 
 # %% auto 0
-__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesDataModule']
+__all__ = ['TimeSeriesLoader', 'TimeSeriesDataset', 'TimeSeriesParquetDataset', 'LengthBucketSampler', 'TimeSeriesWindowDataset',
+           'TimeSeriesWindowBank', 'TimeSeriesWindowSampler', 'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import copy
+import multiprocessing
+import os
+import pickle
+import warnings
 from collections.abc import Mapping
 
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
 import torch
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, IterableDataset, Sampler
 
 # %% ../nbs/tsdataset.ipynb 5
+def _to_arrow(df):
+    # Polars frames share their buffers with Arrow, pandas frames are kept
+    if type(df).__module__.split(".")[0] == "polars":
+        return df.to_arrow()
+    return df
+
+
+def _to_pandas(df):
+    if isinstance(df, pd.DataFrame):
+        return df
+    return _to_arrow(df).to_pandas()
+
+
+def _reindex_columns(df, columns):
+    # Select `columns`, missing columns are filled with nulls
+    df = _to_arrow(df)
+    if isinstance(df, pd.DataFrame):
+        if df.index.name == "unique_id":
+            df = df.reset_index()
+        return df.reindex(columns=columns)
+    import pyarrow as pa
+
+    for col in columns:
+        if col not in df.column_names:
+            df = df.append_column(col, pa.nulls(len(df), pa.float32()))
+    return df.select(columns)
+
+
+def _select_columns(cols, columns):
+    # Positions of `columns` in `cols`, kept in the dataset order
+    if columns is None:
+        return None, cols
+    idx = cols.get_indexer(columns)
+    if np.any(idx == -1):
+        missing = [col for col, i in zip(columns, idx) if i == -1]
+        raise Exception(f"{missing} not in the dataset columns.")
+    idx = np.unique(idx)
+    return torch.from_numpy(idx), cols[idx]
+
+
+def _arrow_factorize(values, sort=False):
+    # pd.factorize for Arrow arrays, the codes are computed by Arrow's hash kernels
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_dictionary(values.type):
+        values = values.cast(values.type.value_type)
+    uniques = pc.unique(values)
+    if sort:
+        uniques = uniques.take(pc.array_sort_indices(uniques))
+    codes = pc.index_in(values, value_set=uniques).to_numpy()
+    return codes, pd.Index(uniques.to_pandas())
+
+
+def _series_summary(y, indptr):
+    # Per-serie statistics of `y` with grouped reductions, NaNs are not observed
+    sizes = np.diff(indptr).astype(np.int64)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+    y = pd.Series(y)
+    by_serie = y.groupby(groups)
+    y_median = by_serie.median().reindex(range(len(sizes)))
+    summary = pd.DataFrame(
+        dict(
+            size=sizes,
+            n_observed=by_serie.count().reindex(range(len(sizes)), fill_value=0),
+            y_mean=by_serie.mean(),
+            y_std=by_serie.std(ddof=0),
+            y_median=y_median,
+            y_mad=(y - y_median.to_numpy()[groups]).abs().groupby(groups).median(),
+        ),
+        index=pd.RangeIndex(len(sizes)),
+    )
+
+    # Offset of the first observed value of each serie, its size when it has none
+    observed_rows = np.flatnonzero(y.notna().to_numpy())
+    first_groups, first_idx = np.unique(groups[observed_rows], return_index=True)
+    first_valid = sizes.copy()
+    first_valid[first_groups] = observed_rows[first_idx] - indptr[first_groups]
+    summary.insert(2, "first_valid", first_valid)
+    return summary
+
+
+def _series_ds(first_ds, sizes, freq):
+    # Dates of every row of regularly spaced series from their first date and size
+    steps = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    if issubclass(first_ds.dtype.type, np.integer):
+        return np.repeat(first_ds, sizes) + steps
+    if freq is None:
+        raise Exception("The frequency of the series is needed to rebuild their dates.")
+    first_ds = pd.DatetimeIndex(first_ds)
+    # Series starting on a common grid are read from a single date_range
+    positions = pd.date_range(first_ds.min(), first_ds.max(), freq=freq).get_indexer(
+        first_ds
+    )
+    if np.all(positions >= 0):
+        grid = pd.date_range(
+            first_ds.min(), periods=(positions + sizes).max(), freq=freq
+        )
+        return grid.to_numpy()[np.repeat(positions, sizes) + steps]
+    return np.concatenate(
+        [
+            pd.date_range(start, periods=size, freq=freq).to_numpy()
+            for start, size in zip(first_ds, sizes)
+        ]
+    )
+
+
+def _series_last_ds(first_ds, sizes, freq):
+    # Last date of regularly spaced series from their first date and size
+    if issubclass(first_ds.dtype.type, np.integer):
+        return first_ds + sizes - 1
+    first_ds = pd.DatetimeIndex(first_ds)
+    positions = pd.date_range(first_ds.min(), first_ds.max(), freq=freq).get_indexer(
+        first_ds
+    )
+    if np.all(positions >= 0):
+        grid = pd.date_range(
+            first_ds.min(), periods=(positions + sizes).max(), freq=freq
+        )
+        return grid.to_numpy()[positions + sizes - 1]
+    # Off grid series are shifted by size, each size at once
+    offset = pd.tseries.frequencies.to_offset(freq)
+    last_ds = np.empty(len(first_ds), dtype=first_ds.dtype)
+    for size in np.unique(sizes):
+        is_size = sizes == size
+        last_ds[is_size] = (first_ds[is_size] + (size - 1) * offset).to_numpy()
+    return last_ds
+
+
+def _load_npy(filename, mmap=False, dtype=None, stat=None):
+    # Tensor of a `.npy` file, viewed as `dtype`. With `mmap` it is memory-mapped
+    # copy-on-write and keeps its file, to be mapped again instead of copied
+    file_stat = os.stat(filename)
+    file_stat = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+    if stat is not None and stat != file_stat:
+        raise Exception(
+            f"{filename} changed since the dataset was memory-mapped from it, "
+            "load the dataset with mmap=False to pickle its values."
+        )
+    tensor = torch.from_numpy(np.load(filename, mmap_mode="c" if mmap else None))
+    if dtype is not None:
+        tensor = tensor.view(dtype)
+    if mmap:
+        tensor._file = (filename, file_stat)
+    return tensor
+
+
+def _is_mapped(tensor):
+    # Whether the tensor is memory-mapped from a file by `_load_npy`
+    return getattr(tensor, "_file", None) is not None
+
+
+def _share_memory(tensor):
+    # Moves a tensor to shared memory, memory-mapped ones are already shared by their file
+    if not _is_mapped(tensor):
+        tensor.share_memory_()
+
+
+class _TensorState:
+    # Pickled form of a tensor. Memory-mapped tensors are mapped again from
+    # their file. Tensors in shared memory are left to torch's pickler, that
+    # sends them to DataLoader workers as handles. Other tensors are pickled
+    # as numpy arrays, that protocol 5 passes out-of-band: Ray's object store
+    # holds them once and every Tune trial attaches to them without a copy.
+    def __init__(self, tensor):
+        self.dtype = tensor.dtype
+        self.file, self.tensor, self.array = getattr(tensor, "_file", None), None, None
+        if self.file is None and tensor.is_shared():
+            self.tensor = tensor
+        elif self.file is None:
+            self.array = (
+                tensor.view(torch.int16) if tensor.dtype == torch.bfloat16 else tensor
+            ).numpy()
+
+    def unpack(self):
+        if self.file is not None:
+            return _load_npy(
+                self.file[0], mmap=True, dtype=self.dtype, stat=self.file[1]
+            )
+        if self.tensor is not None:
+            return self.tensor
+        with warnings.catch_warnings():
+            # Arrays of Ray's object store are read-only, the dataset never writes them
+            warnings.simplefilter("ignore", UserWarning)
+            return torch.from_numpy(self.array).view(self.dtype)
+
+
+def _pack_state(state):
+    # Copy of an object's `__dict__` with its tensors, also in lists, as `_TensorState`
+    pack = lambda value: _TensorState(value) if torch.is_tensor(value) else value
+    return {
+        name: [pack(item) for item in value] if isinstance(value, list) else pack(value)
+        for name, value in state.items()
+    }
+
+
+def _unpack_state(state):
+    unpack = lambda value: value.unpack() if isinstance(value, _TensorState) else value
+    return {
+        name: [unpack(item) for item in value]
+        if isinstance(value, list)
+        else unpack(value)
+        for name, value in state.items()
+    }
+
+
+def _save_npy(filename, array):
+    # The array can be memory-mapped from `filename` itself, it is written
+    # next to it and moved into place, the mapped file is never truncated
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_filename, filename)
+
+
+def _column_dtypes(dtype, cols):
+    # Storage dtype of every temporal column, columns missing from a dict are float32
+    if isinstance(dtype, Mapping):
+        return [dtype.get(col, torch.float32) for col in cols]
+    return [dtype] * len(cols)
+
+
+def _check_storage_dtype(col, values, dtype):
+    # `y` and continuous columns can be rounded to a half precision dtype,
+    # flags and integer codes must be stored exactly
+    if dtype == torch.float32:
+        return values
+    if not dtype.is_floating_point and np.isnan(values).all():
+        # Columns only filled with nulls, like the hist exog of future rows
+        return np.zeros_like(values)
+    original = torch.from_numpy(values)
+    stored = original.to(dtype).float()
+    if torch.allclose(stored, original, rtol=0, atol=0, equal_nan=True):
+        return values
+    is_integral = np.all(np.isnan(values) | (values == np.round(values)))
+    if not dtype.is_floating_point or (col != "y" and is_integral):
+        raise Exception(
+            f"Column {col} is not exactly representable as {dtype}, store it in a wider dtype."
+        )
+    return values
+
+
+def _temporal_file(k):
+    # File of the k-th block of a saved temporal block
+    return "temporal.npy" if k == 0 else f"temporal_{k}.npy"
+
+# %% ../nbs/tsdataset.ipynb 6
+# Number of set bits of every byte
+_POPCOUNT = torch.tensor([bin(byte).count("1") for byte in range(256)])
+
+
+class _SparseTemporal:
+    # Sparse storage of a [N, C] temporal block: a bitmap per column of its
+    # nonzero entries (NaNs included), packed 8 rows per byte, and their
+    # values column after column. The nonzero entries before every 64 rows
+    # of each column are kept in `rank`, so the value of any entry is found
+    # in O(1). Rows are densified on demand, only for the requested ones.
+    def __init__(self, bitmap, values, shape):
+        self.bitmap = torch.as_tensor(bitmap, dtype=torch.uint8)
+        self.values = torch.as_tensor(values)
+        self.shape = torch.Size(shape)
+        self.dtype = self.values.dtype
+        counts = _POPCOUNT[self.bitmap.long()].reshape(self.shape[1], -1, 8).sum(2)
+        self.rank = (torch.cumsum(counts, 1) - counts).to(torch.int32)
+        self.col_ptr = torch.cat(
+            [torch.zeros(1, dtype=torch.long), torch.cumsum(counts.sum(1), 0)]
+        )
+
+    @staticmethod
+    def from_dense(temporal):
+        temporal = torch.as_tensor(temporal)
+        return _SparseTemporal.from_columns(
+            temporal.unbind(1), shape=temporal.shape, dtype=temporal.dtype
+        )
+
+    @staticmethod
+    def from_columns(columns, shape, dtype):
+        # Sparse block from an iterable of its columns, read one at a time,
+        # the bitmaps are padded to whole 64 rows words
+        n_bytes = -(-shape[0] // 64) * 8
+        bitmap = torch.zeros((shape[1], n_bytes), dtype=torch.uint8)
+        values = []
+        for j, column in enumerate(columns):
+            column = torch.as_tensor(column)
+            nonzero = column != 0
+            bits = np.packbits(nonzero.numpy(), bitorder="little")
+            bitmap[j, : len(bits)] = torch.from_numpy(bits)
+            values.append(column[nonzero].to(dtype))
+        values = torch.cat(values) if values else torch.empty(0, dtype=dtype)
+        return _SparseTemporal(bitmap=bitmap, values=values, shape=shape)
+
+    @property
+    def nbytes(self):
+        return sum(
+            t.numel() * t.element_size()
+            for t in [self.bitmap, self.values, self.rank, self.col_ptr]
+        )
+
+    def take(self, rows, cols=None):
+        # Dense [*rows.shape, C] rows in storage dtype, the position of each
+        # nonzero entry in `values` is its column's rank at the entry
+        cols = torch.arange(self.shape[1]) if cols is None else torch.as_tensor(cols)
+        flat_rows = rows.reshape(-1)
+        out = torch.zeros((len(flat_rows), len(cols)), dtype=self.dtype)
+        byte = self.bitmap[cols, flat_rows[:, None] >> 3].long()
+        present = (byte >> (flat_rows[:, None] & 7)) & 1
+        idx, col_idx = torch.nonzero(present, as_tuple=True)
+        r, c = flat_rows[idx], cols[col_idx]
+        # Set bits of the entry's word before its byte and of its byte before its bit
+        word_bytes = self.bitmap[
+            c[:, None], (r >> 6 << 3)[:, None] + torch.arange(8)
+        ].long()
+        before = torch.arange(8) < ((r >> 3) & 7)[:, None]
+        rank = (
+            self.rank[c, r >> 6].long()
+            + (_POPCOUNT[word_bytes] * before).sum(1)
+            + _POPCOUNT[byte[idx, col_idx] & ((1 << (r & 7)) - 1)]
+        )
+        out[idx, col_idx] = self.values[self.col_ptr[c] + rank]
+        return out.reshape(*rows.shape, len(cols))
+
+    def column(self, col):
+        nonzero = np.unpackbits(self.bitmap[col].numpy(), bitorder="little")[
+            : self.shape[0]
+        ]
+        out = torch.zeros(self.shape[0], dtype=self.dtype)
+        out[torch.from_numpy(nonzero.astype(bool))] = self.values[
+            self.col_ptr[col] : self.col_ptr[col + 1]
+        ]
+        return out
+
+    def share_memory_(self):
+        for tensor in [self.bitmap, self.values, self.rank, self.col_ptr]:
+            _share_memory(tensor)
+        return self
+
+    def is_shared(self):
+        return all(
+            tensor.is_shared() or _is_mapped(tensor)
+            for tensor in [self.bitmap, self.values]
+        )
+
+    def __getstate__(self):
+        return _pack_state(self.__dict__)
+
+    def __setstate__(self, state):
+        self.__dict__.update(_unpack_state(state))
+
+
+class _GroupedTemporal:
+    # Dense [N, C] temporal block stored as one tensor per storage dtype,
+    # the k-th block holds the columns `cols[k]`. Rows are gathered from
+    # every block and upcast to float32, only for the requested ones.
+    def __init__(self, blocks, cols):
+        self.blocks = [torch.as_tensor(block) for block in blocks]
+        self.cols = [
+            torch.as_tensor(block_cols, dtype=torch.long) for block_cols in cols
+        ]
+        n_cols = sum(len(block_cols) for block_cols in self.cols)
+        self.shape = torch.Size((len(self.blocks[0]), n_cols))
+        self.dtype = torch.float32
+        # Block of each column and its position in the block
+        self.block_idx = torch.empty(n_cols, dtype=torch.long)
+        self.block_pos = torch.empty(n_cols, dtype=torch.long)
+        for k, block_cols in enumerate(self.cols):
+            self.block_idx[block_cols] = k
+            self.block_pos[block_cols] = torch.arange(len(block_cols))
+
+    @property
+    def dtypes(self):
+        # Storage dtype of every column
+        return [self.blocks[k].dtype for k in self.block_idx.tolist()]
+
+    @property
+    def nbytes(self):
+        return sum(block.numel() * block.element_size() for block in self.blocks)
+
+    def take(self, rows, cols=None):
+        # Dense float32 [*rows.shape, C] rows, each block fills its own columns
+        cols = torch.arange(self.shape[1]) if cols is None else torch.as_tensor(cols)
+        out = torch.empty((*rows.shape, len(cols)), dtype=torch.float32)
+        for k, block in enumerate(self.blocks):
+            in_block = self.block_idx[cols] == k
+            if in_block.any():
+                out[..., in_block] = block[
+                    rows[..., None], self.block_pos[cols[in_block]]
+                ].float()
+        return out
+
+    def column(self, col):
+        return self.blocks[self.block_idx[col]][:, self.block_pos[col]]
+
+    def share_memory_(self):
+        for tensor in self.blocks + self.cols + [self.block_idx, self.block_pos]:
+            _share_memory(tensor)
+        return self
+
+    def is_shared(self):
+        return all(block.is_shared() or _is_mapped(block) for block in self.blocks)
+
+    def __getstate__(self):
+        return _pack_state(self.__dict__)
+
+    def __setstate__(self, state):
+        self.__dict__.update(_unpack_state(state))
+
+
+def _gather(temporal, rows, cols=None):
+    # [*rows.shape, C] rows of a temporal block, only the `cols` columns when
+    # given, storage classes gather them themselves
+    if not torch.is_tensor(temporal):
+        return temporal.take(rows, cols)
+    if cols is None:
+        return temporal[rows]
+    return temporal[rows[..., None], cols]
+
+
+def _select_rows(temporal, rows):
+    # Block of the same storage with the `rows` of `temporal`
+    if torch.is_tensor(temporal):
+        return temporal[rows]
+    if isinstance(temporal, _GroupedTemporal):
+        return _GroupedTemporal(
+            [block[rows] for block in temporal.blocks], temporal.cols
+        )
+    return _SparseTemporal.from_dense(temporal.take(rows))
+
+
+def _concat_rows(blocks):
+    # Rows of blocks of the same storage one after the other
+    first = blocks[0]
+    if torch.is_tensor(first):
+        return torch.cat([block.to(first.dtype) for block in blocks])
+    if isinstance(first, _GroupedTemporal):
+        return _GroupedTemporal(
+            [
+                torch.cat([block.blocks[k] for block in blocks])
+                for k in range(len(first.blocks))
+            ],
+            first.cols,
+        )
+    columns = (
+        torch.cat([block.column(j) for block in blocks]) for j in range(first.shape[1])
+    )
+    shape = (sum(block.shape[0] for block in blocks), first.shape[1])
+    return _SparseTemporal.from_columns(columns, shape=shape, dtype=first.dtype)
+
+
+def _merge_chunks(chunks, starts, sizes):
+    # Contiguous block with the rows of every serie in the chunks, serie after serie
+    block = _concat_rows(chunks)
+    starts = (
+        starts + np.cumsum([0] + [chunk.shape[0] for chunk in chunks[:-1]])[:, None]
+    )
+    starts, sizes = starts.T.reshape(-1), sizes.T.reshape(-1)
+    rows = np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())
+    return _select_rows(block, torch.from_numpy(rows))
+
+
+class _ChunkedTemporal:
+    # [N, C] temporal block of series extended with new rows, the stored rows
+    # are not copied. The k-th chunk is a block holding `sizes[k, i]` rows of
+    # serie i from its row `starts[k, i]`, a serie's rows are the ones of
+    # every chunk in order and are indexed like in a contiguous block. The
+    # last chunks are merged while they have comparable sizes, so there are
+    # O(log N) of them and each row is copied O(log N) times. The first
+    # `pinned` chunks, memory-mapped from a file, are never merged.
+    def __init__(self, chunks, starts, sizes, pinned=0):
+        self.chunks = list(chunks)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.pinned = pinned
+        self.offsets = np.cumsum(self.sizes, axis=0) - self.sizes
+        self.indptr = np.append(0, np.cumsum(self.sizes.sum(axis=0)))
+        self.shape = torch.Size((int(self.indptr[-1]), self.chunks[0].shape[1]))
+        self.dtype = self.chunks[0].dtype
+
+    @staticmethod
+    def extend(temporal, indptr, new_temporal, new_starts, new_sizes, pinned=0):
+        # `temporal` whose series are followed by the `new_sizes` rows of
+        # `new_temporal` from `new_starts`, series beyond `indptr` are new
+        if isinstance(temporal, _ChunkedTemporal):
+            chunks, starts, sizes, pinned = (
+                temporal.chunks,
+                temporal.starts,
+                temporal.sizes,
+                temporal.pinned,
+            )
+        else:
+            chunks, starts, sizes = [temporal], indptr[None, :-1], np.diff(indptr)[None]
+        n_new = len(new_sizes) - starts.shape[1]
+        chunks = chunks + [new_temporal]
+        starts = np.vstack([np.pad(starts, ((0, 0), (0, n_new))), new_starts])
+        sizes = np.vstack([np.pad(sizes, ((0, 0), (0, n_new))), new_sizes])
+        while len(chunks) > pinned + 1 and sizes[-2].sum() <= 2 * sizes[-1].sum():
+            merged_sizes = sizes[-2:].sum(axis=0)
+            chunks = chunks[:-2] + [_merge_chunks(chunks[-2:], starts[-2:], sizes[-2:])]
+            starts = np.vstack([starts[:-2], np.cumsum(merged_sizes) - merged_sizes])
+            sizes = np.vstack([sizes[:-2], merged_sizes])
+        if len(chunks) == 1:
+            return chunks[0]
+        return _ChunkedTemporal(chunks, starts, sizes, pinned)
+
+    @property
+    def nbytes(self):
+        return sum(
+            chunk.numel() * chunk.element_size()
+            if torch.is_tensor(chunk)
+            else chunk.nbytes
+            for chunk in self.chunks
+        )
+
+    def take(self, rows, cols=None):
+        # [*rows.shape, C] rows, each one gathered from the chunk holding it
+        flat_rows = rows.reshape(-1).numpy()
+        serie = np.searchsorted(self.indptr, flat_rows, side="right") - 1
+        offset = flat_rows - self.indptr[serie]
+        chunk = (self.offsets[:, serie] <= offset).sum(axis=0) - 1
+        physical = torch.from_numpy(
+            self.starts[chunk, serie] + offset - self.offsets[chunk, serie]
+        )
+        chunk = torch.from_numpy(chunk)
+        n_cols = self.shape[1] if cols is None else len(cols)
+        out = torch.empty((len(flat_rows), n_cols), dtype=self.dtype)
+        for k, block in enumerate(self.chunks):
+            in_chunk = chunk == k
+            if in_chunk.any():
+                out[in_chunk] = _gather(block, physical[in_chunk], cols).to(self.dtype)
+        return out.reshape(*rows.shape, n_cols)
+
+    def column(self, col):
+        return self.take(torch.arange(self.shape[0]), [col])[:, 0]
+
+    def compact(self):
+        # Contiguous block of every chunk
+        return _merge_chunks(self.chunks, self.starts, self.sizes)
+
+    def share_memory_(self):
+        for chunk in self.chunks:
+            if torch.is_tensor(chunk):
+                _share_memory(chunk)
+            else:
+                chunk.share_memory_()
+        return self
+
+    def is_shared(self):
+        return all(chunk.is_shared() or _is_mapped(chunk) for chunk in self.chunks)
+
+    def __getstate__(self):
+        return _pack_state(self.__dict__)
+
+    def __setstate__(self, state):
+        self.__dict__.update(_unpack_state(state))
+
+# %% ../nbs/tsdataset.ipynb 7
 class TimeSeriesLoader(DataLoader):
     """TimeSeriesLoader DataLoader.
     [Source code](https://github.com/Nixtla/neuralforecast1/blob/main/neuralforecast/tsdataset.py).
@@ -29,15 +590,52 @@ class TimeSeriesLoader(DataLoader):
     `shuffle`: (bool, optional): set to `True` to have the data reshuffled at every epoch (default: `False`).<br>
     `sampler`: (Sampler or Iterable, optional): defines the strategy to draw samples from the dataset.<br>
                 Can be any `Iterable` with `__len__` implemented. If specified, `shuffle` must not be specified.<br>
+    `temporal_cols`: (list, optional): temporal columns of the batches, defaults to every column of the dataset.<br>
+    `static_cols`: (list, optional): static columns of the batches, defaults to every static column.<br>
+    `tail_size`: (int, optional): number of last steps of each serie in the batches, defaults to every step.<br>
+    `transform`: (callable, optional): function applied to each collated batch, inside the DataLoader workers.<br>
     """
 
-    def __init__(self, dataset, **kwargs):
+    def __init__(
+        self,
+        dataset,
+        temporal_cols=None,
+        static_cols=None,
+        tail_size=None,
+        transform=None,
+        **kwargs,
+    ):
         if "collate_fn" in kwargs:
             kwargs.pop("collate_fn")
-        kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
+        kwargs_ = {**kwargs, **dict(collate_fn=self._transform_collate)}
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
+        # Only the projected columns are padded and collated
+        self.temporal_cols = temporal_cols
+        self.static_cols = static_cols
+        self.tail_size = tail_size
+        self.transform = transform
+        self._temporal_idx, self._temporal_cols = _select_columns(
+            dataset.temporal_cols[:-1], temporal_cols
+        )
+        self._temporal_cols = self._temporal_cols.append(dataset.temporal_cols[-1:])
+        self._static_idx, self._static_cols = None, None
+        if getattr(dataset, "static_cols", None) is not None:
+            self._static_idx, self._static_cols = _select_columns(
+                dataset.static_cols, static_cols
+            )
+
+    def _transform_collate(self, batch):
+        batch = self._collate_fn(batch)
+        if self.transform is not None:
+            batch = self.transform(batch)
+        return batch
+
     def _collate_fn(self, batch):
+        if isinstance(batch, Mapping):
+            # Batches of TimeSeriesDataset.__getitems__ are gathered at once
+            return self._gather_collate(batch)
+
         elem = batch[0]
         elem_type = type(elem)
 
@@ -52,22 +650,62 @@ class TimeSeriesLoader(DataLoader):
             return torch.stack(batch, 0, out=out)
 
         elif isinstance(elem, Mapping):
-            if elem["static"] is None:
-                return dict(
-                    temporal=self.collate_fn([d["temporal"] for d in batch]),
-                    temporal_cols=elem["temporal_cols"],
-                )
-
-            return dict(
-                static=self.collate_fn([d["static"] for d in batch]),
-                static_cols=elem["static_cols"],
-                temporal=self.collate_fn([d["temporal"] for d in batch]),
-                temporal_cols=elem["temporal_cols"],
-            )
+            temporal = self._pad_collate([d["temporal"] for d in batch])
+            static = None
+            if elem["static"] is not None and len(self._static_cols) > 0:
+                static = self._collate_fn([d["static"] for d in batch])
+            return self._static_collate(static, temporal)
 
         raise TypeError(f"Unknown {elem_type}")
 
-# %% ../nbs/tsdataset.ipynb 7
+    def _static_collate(self, static, temporal):
+        if static is None or len(self._static_cols) == 0:
+            return dict(temporal=temporal, temporal_cols=self._temporal_cols)
+        if self._static_idx is not None:
+            static = static[:, self._static_idx]
+        return dict(
+            static=static,
+            static_cols=self._static_cols,
+            temporal=temporal,
+            temporal_cols=self._temporal_cols,
+        )
+
+    def _gather_collate(self, batch):
+        # Only the tails of the left padded rows and the projected columns
+        # are gathered, in a single advanced indexing of the temporal block
+        rows, mask = batch["rows"], batch["available_mask"]
+        if self.tail_size is not None:
+            rows = rows[:, -self.tail_size :]
+            mask = None if mask is None else mask[:, -self.tail_size :]
+        temporal = self.dataset._take(rows, self._temporal_idx)
+        out = torch.ones(
+            (rows.shape[0], len(self._temporal_cols), rows.shape[1]),
+            dtype=torch.float32,
+        )
+        out[:, :-1] = temporal.permute(0, 2, 1)
+        if mask is not None:
+            # Zeroes the padding and sets the available_mask row at once
+            out.masked_fill_(~mask[:, None], 0)
+        return self._static_collate(batch["static"], out)
+
+    def _pad_collate(self, batch):
+        # Left pad the series only up to the longest serie of the batch,
+        # upcast them to float32 and add the available_mask row
+        if self.tail_size is not None:
+            # The items are views, only their tails are copied
+            batch = [x[:, -self.tail_size :] for x in batch]
+        max_size = max(x.shape[-1] for x in batch)
+        out = torch.zeros(
+            (len(batch), len(self._temporal_cols), max_size), dtype=torch.float32
+        )
+        for i, x in enumerate(batch):
+            if self._temporal_idx is not None:
+                x = x[self._temporal_idx]
+            out[i, :-1, max_size - x.shape[-1] :] = x
+            out[i, -1, max_size - x.shape[-1] :] = 1
+        return out
+
+# %% ../nbs/tsdataset.ipynb 9
 class TimeSeriesDataset(Dataset):
     def __init__(
         self,
@@ -81,10 +719,19 @@ class TimeSeriesDataset(Dataset):
     ):
         super().__init__()
 
-        self.temporal = torch.tensor(temporal, dtype=torch.float)
+        # as_tensor shares memory with float32 numpy arrays and tensors,
+        # float16 and bfloat16 blocks are kept as compact storage
+        if not isinstance(
+            temporal, (_SparseTemporal, _GroupedTemporal, _ChunkedTemporal)
+        ):
+            temporal = torch.as_tensor(temporal)
+            if temporal.dtype not in [torch.float16, torch.bfloat16]:
+                temporal = temporal.to(torch.float32)
+        self.temporal = temporal
+        self.sparse = isinstance(self._storage_block(), _SparseTemporal)
         self.temporal_cols = pd.Index(list(temporal_cols) + ["available_mask"])
         if static is not None:
-            self.static = torch.tensor(static, dtype=torch.float)
+            self.static = torch.as_tensor(static, dtype=torch.float)
             self.static_cols = static_cols
         else:
             self.static = static
@@ -93,22 +740,36 @@ class TimeSeriesDataset(Dataset):
         self.indptr = indptr
         self.n_groups = self.indptr.size - 1
         self.max_size = max_size
+        # Batches of panels whose series all share the same length need
+        # no padding nor available_mask
+        self.dense = TimeSeriesDataset._equal_sizes(indptr)
 
         # Upadated flag. To protect consistency, dataset can only be updated once
         self.updated = False
         self.sorted = sorted
+        # Whether the blocks are memory-mapped from the files of `load`
+        self.mmap = False
+
+        # First and last ds of each serie and their frequency, set by the
+        # constructors that know them, the full ds are rebuilt on demand
+        # unless some serie is not regularly spaced
+        self.first_ds = None
+        self.last_ds = None
+        self.freq = None
+        self._ds = None
+        self._summary = None
 
     def __getitem__(self, idx):
         if isinstance(idx, int):
-            # Parse temporal data and pad its left
-            temporal = torch.zeros(
-                size=(len(self.temporal_cols), self.max_size), dtype=torch.float32
-            )
-            ts = self.temporal[self.indptr[idx] : self.indptr[idx + 1], :]
-            temporal[: len(self.temporal_cols) - 1, -len(ts) :] = ts.permute(1, 0)
-
-            # Add available_mask
-            temporal[len(self.temporal_cols) - 1, -len(ts) :] = 1
+            # Parse temporal data in its storage dtype, TimeSeriesLoader
+            # upcasts it, adds the available_mask and left pads the batch
+            if not torch.is_tensor(self.temporal):
+                temporal = self.temporal.take(
+                    torch.arange(self.indptr[idx], self.indptr[idx + 1])
+                )
+            else:
+                temporal = self.temporal[self.indptr[idx] : self.indptr[idx + 1], :]
+            temporal = temporal.permute(1, 0)
 
             # Add static data if available
             static = None if self.static is None else self.static[idx, :]
@@ -123,9 +784,137 @@ class TimeSeriesDataset(Dataset):
             return item
         raise ValueError(f"idx must be int, got {type(idx)}")
 
+    def __getitems__(self, idxs):
+        # Batched fetch of DataLoader's automatic batching. Instead of one
+        # item per serie, returns the [B, T] rows of the left padded batch
+        # in the temporal block, TimeSeriesLoader gathers them at once
+        idxs = np.asarray(idxs)
+        starts = torch.as_tensor(self.indptr[idxs], dtype=torch.long)
+        ends = torch.as_tensor(self.indptr[idxs + 1], dtype=torch.long)
+        max_size = int((ends - starts).max())
+        rows = ends[:, None] - max_size + torch.arange(max_size)
+        mask = None
+        if not self.dense:
+            mask = rows >= starts[:, None]
+            # Padding points to the first row of its serie
+            rows = torch.maximum(rows, starts[:, None])
+        static = None if self.static is None else self.static[torch.as_tensor(idxs)]
+        return dict(
+            rows=rows,
+            available_mask=mask,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+
+    def _take(self, rows, cols=None):
+        # [*rows.shape, C] rows of temporal, only the `cols` columns when given
+        return _gather(self.temporal, rows, cols)
+
     def __len__(self):
         return self.n_groups
 
+    def _storage_block(self):
+        # Block whose storage the new rows of the dataset follow
+        if isinstance(self.temporal, _ChunkedTemporal):
+            return self.temporal.chunks[0]
+        return self.temporal
+
+    def _storage_dtype(self):
+        # `from_df` dtype that stores new rows like the dataset's temporal block
+        temporal = self._storage_block()
+        if isinstance(temporal, _GroupedTemporal):
+            return dict(zip(self.temporal_cols[:-1], temporal.dtypes))
+        return temporal.dtype
+
+    def _extend(self, new_temporal, new_starts, new_sizes):
+        # Temporal block with the `new_sizes` rows of every serie from `new_starts`
+        # of `new_temporal` after the stored ones, which are not copied
+        return _ChunkedTemporal.extend(
+            self.temporal,
+            self.indptr,
+            new_temporal,
+            new_starts,
+            new_sizes,
+            pinned=int(self.mmap),
+        )
+
+    @property
+    def summary(self):
+        """Per-serie summary table, computed once and kept with the dataset.
+
+        Columns are the serie's `size`, its `first_ds` and `last_ds` when
+        known, the number of non-NaN `y` values `n_observed`, the offset of
+        the first one `first_valid`, and the `y_mean`, `y_std`, `y_median`
+        and `y_mad` of those values. The windows of `TimeSeriesWindowDataset`
+        and the length buckets of `TimeSeriesDataModule` are read from it.
+        """
+        if self._summary is None:
+            if "y" in self.temporal_cols:
+                y_idx = self.temporal_cols.get_loc("y")
+                y = (
+                    self.temporal[:, y_idx]
+                    if torch.is_tensor(self.temporal)
+                    else self.temporal.column(y_idx)
+                )
+                y = y.float().numpy()
+            else:
+                y = np.full(self.temporal.shape[0], np.nan, dtype=np.float32)
+            summary = _series_summary(y.astype(np.float64), self.indptr)
+            if self.first_ds is not None:
+                summary.insert(1, "first_ds", self.first_ds)
+                summary.insert(2, "last_ds", self.last_ds)
+            self._summary = summary
+        return self._summary
+
+    @property
+    def ds(self):
+        """Dates of every row, rebuilt from each serie's first date, size and `freq`.
+
+        Only the first and last dates of regularly spaced series are stored,
+        integer dates advance by one. Panels with gaps or irregular dates keep
+        every date.
+        """
+        if self._ds is not None:
+            return self._ds
+        if self.first_ds is None:
+            raise Exception("The first dates of the series are unknown.")
+        ds = _series_ds(self.first_ds, np.diff(self.indptr).astype(np.int64), self.freq)
+        if self.last_ds is not None and not np.array_equal(
+            ds[self.indptr[1:] - 1], self.last_ds
+        ):
+            raise Exception(
+                "The series are not regularly spaced, their dates can't be rebuilt."
+            )
+        return ds
+
+    def _regular(self):
+        # Whether the dates rebuilt from first_ds, the sizes and freq end on last_ds,
+        # datetimes without frequency can't be checked and are assumed regular
+        if self.first_ds is None or self.last_ds is None:
+            return True
+        kind = self.first_ds.dtype.kind
+        if kind not in "iuM":
+            return False
+        if kind == "M" and self.freq is None:
+            return True
+        sizes = np.diff(self.indptr).astype(np.int64)
+        return np.array_equal(
+            _series_last_ds(self.first_ds, sizes, self.freq), self.last_ds
+        )
+
+    @staticmethod
+    def _merged_ds(dataset, merged, sizes, new_sizes, new_ds):
+        # Stored dates of `merged`, each serie of `dataset` followed by its
+        # `new_sizes` new dates, when its series are not regularly spaced
+        if dataset._ds is None and merged._regular():
+            return None
+        mask = TimeSeriesDataset._new_rows_mask(sizes, new_sizes)
+        ds = np.concatenate([dataset.ds, new_ds])
+        ds[~mask] = dataset.ds
+        ds[mask] = new_ds
+        return ds
+
     def __repr__(self):
         return (
             f"TimeSeriesDataset(n_data={self.data.size:,}, n_groups={self.n_groups:,})"
@@ -138,96 +927,420 @@ class TimeSeriesDataset(Dataset):
             self.indptr, other.indptr
         )
 
+    def __getstate__(self):
+        # The tensors of the dataset and of its storage classes are pickled
+        # as `_TensorState`, memory-mapped blocks are not copied
+        return _pack_state(self.__dict__)
+
+    def __setstate__(self, state):
+        for name in ["temporal", "static"]:
+            # Previous versions pickled the arrays with their dtype
+            if isinstance(state[name], tuple):
+                array, dtype = state[name]
+                state[name] = torch.from_numpy(array).view(dtype)
+        self.__dict__.update(_unpack_state(state))
+        # Datasets pickled by previous versions miss the attributes added since
+        for name in ["first_ds", "last_ds", "freq", "_ds", "_summary"]:
+            self.__dict__.setdefault(name, None)
+        self.__dict__.setdefault("mmap", False)
+        self.sparse = isinstance(self._storage_block(), _SparseTemporal)
+        self.dense = TimeSeriesDataset._equal_sizes(self.indptr)
+
     @staticmethod
-    def update_dataset(dataset, future_df):
-        """Add future observations to the dataset."""
+    def _equal_sizes(indptr):
+        # Whether every serie has the same nonzero size
+        sizes = np.diff(indptr)
+        return len(sizes) > 0 and sizes[0] > 0 and bool(np.all(sizes == sizes[0]))
+
+    def share_memory(self):
+        """Move `temporal` and `static` to shared memory.
+
+        DataLoader workers that are spawned instead of forked then attach
+        to them, rather than receiving their own copy of the dataset.
+        Memory-mapped blocks stay in their file, workers map it again.
+        """
+        if torch.is_tensor(self.temporal):
+            _share_memory(self.temporal)
+        else:
+            self.temporal.share_memory_()
+        if self.static is not None:
+            _share_memory(self.static)
+        return self
+
+    def save(self, path):
+        """Save the dataset as a directory of `.npy` arrays and metadata.
 
-        # Add Nones to missing columns (without available_mask)
+        The arrays keep their in-memory layout, so `TimeSeriesDataset.load`
+        can memory-map them instead of reading them into RAM.
+        """
+        os.makedirs(path, exist_ok=True)
+        temporal = self.temporal
+        if isinstance(temporal, _ChunkedTemporal):
+            temporal = temporal.compact()
+        if isinstance(temporal, _GroupedTemporal):
+            blocks = temporal.blocks
+        else:
+            blocks = [
+                temporal.values if isinstance(temporal, _SparseTemporal) else temporal
+            ]
+        for k, block in enumerate(blocks):
+            if block.dtype == torch.bfloat16:
+                # numpy has no bfloat16, its bits are stored as int16
+                block = block.view(torch.int16)
+            _save_npy(f"{path}/{_temporal_file(k)}", block.numpy())
+        k = len(blocks)
+        while os.path.exists(f"{path}/{_temporal_file(k)}"):
+            os.remove(f"{path}/{_temporal_file(k)}")
+            k += 1
+        if isinstance(temporal, _SparseTemporal):
+            _save_npy(f"{path}/temporal_bitmap.npy", temporal.bitmap.numpy())
+        elif os.path.exists(f"{path}/temporal_bitmap.npy"):
+            os.remove(f"{path}/temporal_bitmap.npy")
+        _save_npy(f"{path}/indptr.npy", self.indptr)
+        if self.static is not None:
+            _save_npy(f"{path}/static.npy", self.static.numpy())
+        elif os.path.exists(f"{path}/static.npy"):
+            os.remove(f"{path}/static.npy")
+
+        meta = dict(
+            temporal_cols=self.temporal_cols[:-1],
+            temporal_dtypes=[block.dtype for block in blocks],
+            temporal_groups=[cols.tolist() for cols in temporal.cols]
+            if isinstance(temporal, _GroupedTemporal)
+            else None,
+            temporal_shape=temporal.shape,
+            static_cols=self.static_cols,
+            max_size=self.max_size,
+            updated=self.updated,
+            sorted=self.sorted,
+            first_ds=self.first_ds,
+            last_ds=self.last_ds,
+            freq=self.freq,
+            ds=self._ds,
+            summary=self._summary,
+        )
+        with open(f"{path}/meta.pkl", "wb") as f:
+            pickle.dump(meta, f)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """Load a dataset stored with `TimeSeriesDataset.save`.
+
+        With `mmap=True` the arrays are memory-mapped copy-on-write, pages are
+        read lazily from disk and shared by the DataLoader workers.
+        """
+        with open(f"{path}/meta.pkl", "rb") as f:
+            meta = pickle.load(f)
+        blocks = []
+        for k, block_dtype in enumerate(
+            meta.get("temporal_dtypes", [meta.get("temporal_dtype")])
+        ):
+            # bfloat16 blocks are stored as int16
+            blocks.append(
+                _load_npy(
+                    f"{path}/{_temporal_file(k)}",
+                    mmap=mmap,
+                    dtype=torch.bfloat16 if block_dtype == torch.bfloat16 else None,
+                )
+            )
+        temporal = blocks[0]
+        if meta.get("temporal_groups") is not None:
+            temporal = _GroupedTemporal(blocks, meta["temporal_groups"])
+        if os.path.exists(f"{path}/temporal_bitmap.npy"):
+            bitmap = _load_npy(f"{path}/temporal_bitmap.npy", mmap=mmap)
+            temporal = _SparseTemporal(
+                bitmap=bitmap, values=temporal, shape=meta["temporal_shape"]
+            )
+        indptr = np.load(f"{path}/indptr.npy")
+        static = None
+        if os.path.exists(f"{path}/static.npy"):
+            static = _load_npy(f"{path}/static.npy", mmap=mmap)
+
+        dataset = TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=meta["temporal_cols"],
+            indptr=indptr,
+            max_size=meta["max_size"],
+            static=static,
+            static_cols=meta["static_cols"],
+            sorted=meta["sorted"],
+        )
+        dataset.updated = meta["updated"]
+        dataset.mmap = mmap
+        dataset.first_ds = meta.get("first_ds")
+        dataset.last_ds = meta.get("last_ds")
+        dataset.freq = meta.get("freq")
+        dataset._ds = meta.get("ds")
+        dataset._summary = meta.get("summary")
+        return dataset
+
+    @staticmethod
+    def update_dataset(dataset, future_df, indices=None):
+        """Add future observations to the dataset.
+
+        With the dataset's series ids `indices`, the series of `future_df` are
+        matched to them by id, otherwise by their position once sorted.
+        """
+
+        # Add NaNs to missing columns (without available_mask) and
+        # sort columns to match self.temporal_cols
         temporal_cols = dataset.temporal_cols.copy()
         temporal_cols = temporal_cols.delete(len(temporal_cols) - 1)
-        for col in temporal_cols:
-            if col not in future_df.columns:
-                future_df[col] = None
-
-        # Sort columns to match self.temporal_cols
-        future_df = future_df[["unique_id", "ds"] + temporal_cols.tolist()]
+        future_df = _reindex_columns(
+            future_df, ["unique_id", "ds"] + temporal_cols.tolist()
+        )
 
         # Process future_df
-        futr_dataset, indices, futr_dates, futr_index = dataset.from_df(
-            df=future_df, sort_df=dataset.sorted
+        futr_dataset, futr_indices, futr_dates, futr_ds = dataset.from_df(
+            df=future_df,
+            sort_df=dataset.sorted,
+            dtype=dataset._storage_dtype(),
+            sparse=dataset.sparse,
         )
+        if futr_dataset.n_groups != dataset.n_groups:
+            raise Exception(
+                "future_df must contain observations for every serie of the dataset."
+            )
 
-        # Define and fill new temporal with updated information
-        len_temporal, col_temporal = dataset.temporal.shape
-        new_temporal = torch.zeros(size=(len_temporal + len(future_df), col_temporal))
-        new_indptr = [0]
-        new_max_size = 0
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = (
-                series_length + futr_dataset.indptr[i + 1] - futr_dataset.indptr[i]
+        futr_rows = np.arange(futr_dataset.indptr[-1])
+        futr_starts = futr_dataset.indptr[:-1]
+        futr_sizes = np.diff(futr_dataset.indptr)
+        futr_last_ds = futr_dataset.last_ds
+        if indices is not None:
+            # Future rows in the order of the dataset's series, appended
+            # series can sort before the ones they follow
+            positions = indices.get_indexer(futr_indices)
+            if np.any(positions == -1):
+                raise Exception("future_df contains series missing from the dataset.")
+            order = np.argsort(positions, kind="stable")
+            futr_rows = TimeSeriesDataset._serie_rows(futr_dataset.indptr, order)
+            futr_starts, futr_sizes, futr_last_ds = (
+                futr_starts[order],
+                futr_sizes[order],
+                futr_last_ds[order],
             )
-            new_temporal[acum : (acum + series_length), :] = dataset.temporal[
-                dataset.indptr[i] : dataset.indptr[i + 1], :
-            ]
-            new_temporal[
-                (acum + series_length) : (acum + new_length), :
-            ] = futr_dataset.temporal[
-                futr_dataset.indptr[i] : futr_dataset.indptr[i + 1], :
-            ]
 
-            acum += new_length
-            new_indptr.append(acum)
-            if new_length > new_max_size:
-                new_max_size = new_length
+        # Each serie's history is followed by its future rows, read from
+        # the future block instead of copying the history next to them
+        sizes = np.vstack([np.diff(dataset.indptr), futr_sizes])
+        new_temporal = dataset._extend(futr_dataset.temporal, futr_starts, futr_sizes)
+        new_indptr = np.append(0, np.cumsum(sizes.sum(axis=0)))
+        new_max_size = sizes.sum(axis=0).max()
 
         # Define new dataset
         updated_dataset = TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=temporal_cols,
-            indptr=np.array(new_indptr).astype(np.int32),
+            indptr=new_indptr.astype(np.int32),
             max_size=new_max_size,
             static=dataset.static,
             static_cols=dataset.static_cols,
             sorted=dataset.sorted,
         )
+        updated_dataset.first_ds = dataset.first_ds
+        updated_dataset.last_ds = futr_last_ds
+        updated_dataset.freq = dataset.freq
+        updated_dataset.mmap = dataset.mmap
+        updated_dataset._ds = TimeSeriesDataset._merged_ds(
+            dataset, updated_dataset, sizes[0], sizes[1], futr_ds[futr_rows]
+        )
 
         return updated_dataset
 
     @staticmethod
-    def from_df(df, static_df=None, sort_df=False):
+    def _serie_rows(indptr, order):
+        # Rows of the series `order` of a temporal block, one serie after the other
+        starts, lens = indptr[:-1][order], np.diff(indptr)[order]
+        return np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+
+    @staticmethod
+    def _new_rows_mask(sizes, new_sizes):
+        # Rows mask of the new observations once each serie is followed by them
+        runs = np.vstack([sizes, new_sizes]).T.flatten()
+        return np.repeat(np.tile([False, True], len(sizes)), runs)
+
+    @staticmethod
+    def append(dataset, df, indices, dates):
+        """Append new observations at the end of the dataset's series.
+
+        Only the new rows are processed and the stored history is not copied,
+        the new rows are kept in chunks that are merged as they grow, so
+        appends take amortized O(new rows).
+        Series of `df` missing from `indices` are added after the others.
+        Returns the new dataset, indices and last dates like `from_df`.
+        """
+        temporal_cols = dataset.temporal_cols.delete(len(dataset.temporal_cols) - 1)
+        df = _reindex_columns(df, ["unique_id", "ds"] + temporal_cols.tolist())
+        new_dataset, new_indices, new_dates, new_ds = TimeSeriesDataset.from_df(
+            df=df,
+            sort_df=dataset.sorted,
+            dtype=dataset._storage_dtype(),
+            sparse=dataset.sparse,
+        )
+
+        # Positions of the new rows' series, unseen series go last
+        positions = indices.get_indexer(new_indices)
+        is_new = positions == -1
+        is_old = ~is_new
+        if np.any(new_dataset.first_ds[is_old] <= dates[positions[is_old]]):
+            raise Exception(
+                "df must contain observations after the last date of each serie."
+            )
+        if is_new.any():
+            if dataset.static is not None:
+                raise Exception(
+                    "df contains series without static features in the dataset."
+                )
+            positions[is_new] = len(indices) + np.arange(is_new.sum())
+            indices = indices.append(new_indices[is_new])
+            dates = dates.append(new_dates[is_new])
+
+        # Rows of the new block for each of the dataset's series
+        sizes = np.zeros(len(indices), dtype=np.int64)
+        sizes[: dataset.n_groups] = np.diff(dataset.indptr)
+        append_starts = np.zeros(len(indices), dtype=np.int64)
+        append_starts[positions] = new_dataset.indptr[:-1]
+        append_sizes = np.zeros(len(indices), dtype=np.int64)
+        append_sizes[positions] = np.diff(new_dataset.indptr)
+
+        temporal = dataset._extend(new_dataset.temporal, append_starts, append_sizes)
+        indptr = np.append(0, np.cumsum(sizes + append_sizes)).astype(np.int32)
+
+        appended_dataset = TimeSeriesDataset(
+            temporal=temporal,
+            temporal_cols=temporal_cols,
+            indptr=indptr,
+            max_size=(sizes + append_sizes).max(),
+            static=dataset.static,
+            static_cols=dataset.static_cols,
+            sorted=dataset.sorted,
+        )
+
+        # First and last dates of the extended series
+        last_dates = dates.to_numpy().copy()
+        last_dates[positions] = new_dates.to_numpy()
+        dates = pd.Index(last_dates, name="ds")
+        if dataset.first_ds is not None:
+            appended_dataset.first_ds = np.concatenate(
+                [dataset.first_ds, new_dataset.first_ds[is_new]]
+            )
+        appended_dataset.last_ds = last_dates
+        appended_dataset.freq = dataset.freq
+        appended_dataset.mmap = dataset.mmap
+        rows = TimeSeriesDataset._serie_rows(
+            new_dataset.indptr, np.argsort(positions, kind="stable")
+        )
+        appended_dataset._ds = TimeSeriesDataset._merged_ds(
+            dataset, appended_dataset, sizes, append_sizes, new_ds[rows]
+        )
+        return appended_dataset, indices, dates
+
+    @staticmethod
+    def from_df(
+        df, static_df=None, sort_df=False, dtype=torch.float32, sparse=False, freq=None
+    ):
+        """Build a dataset from a pandas or polars DataFrame or a pyarrow Table.
+
+        Arrow and polars columns are read from their buffers, without an
+        intermediate pandas frame. `dtype` is the storage dtype of the
+        temporal columns, or a dict of the dtypes of some of them, the others
+        stay float32. Flags and integer codes must be exactly representable
+        in their dtype. With `sparse=True` only the nonzero values are
+        stored, for intermittent series mostly made of zeros.
+        Returns the dataset, the series' ids, their last dates and the ds
+        of every row. Only the first and last dates are kept by the dataset,
+        with `freq` its `ds` are rebuilt on demand.
+        """
         # TODO: protect on equality of static_df + df indexes
-        # Define indexes if not given
-        if df.index.name != "unique_id":
-            df = df.set_index("unique_id")
-            if static_df is not None:
+        df = _to_arrow(df)
+        if static_df is not None:
+            static_df = _to_pandas(static_df)
+            if static_df.index.name != "unique_id":
                 static_df = static_df.set_index("unique_id")
 
-        df = df.set_index("ds", append=True)
-
-        # Sort data by index
-        if not df.index.is_monotonic_increasing and sort_df:
-            df = df.sort_index()
+        # Integer codes of the series, sorted codes follow the series order
+        if isinstance(df, pd.DataFrame):
+            # Define indexes if not given
+            uids = df.index if df.index.name == "unique_id" else df["unique_id"]
+            codes, uniques = pd.factorize(uids, sort=sort_df)
+            ds = df["ds"].to_numpy()
+            temporal_cols = df.columns.drop(["unique_id", "ds"], errors="ignore")
+            get_column = lambda col: df[col].to_numpy(dtype=np.float32)
+        else:
+            codes, uniques = _arrow_factorize(df.column("unique_id"), sort=sort_df)
+            ds = df.column("ds").to_numpy()
+            temporal_cols = pd.Index(df.column_names).drop(["unique_id", "ds"])
+            get_column = (
+                lambda col: df.column(col).to_numpy().astype(np.float32, copy=False)
+            )
+        order = None
+        if sort_df:
+            # Stable argsort by (unique_id, ds), skipped for sorted data
+            is_sorted = np.all(codes[1:] >= codes[:-1])
+            if is_sorted:
+                same_serie = codes[1:] == codes[:-1]
+                is_sorted = np.all(ds[1:][same_serie] >= ds[:-1][same_serie])
+            if not is_sorted:
+                ds_key = pd.factorize(ds, sort=True)[0] if ds.dtype == object else ds
+                order = np.lexsort((ds_key, codes))
+                codes = codes[order]
+                ds = ds[order]
 
-            if static_df is not None:
+            if static_df is not None and not static_df.index.is_monotonic_increasing:
                 static_df = static_df.sort_index()
 
-        # Create auxiliary temporal indices 'indptr'
-        temporal = df.values.astype(np.float32)
-        temporal_cols = df.columns
-        indices_sizes = df.index.get_level_values("unique_id").value_counts(sort=False)
-        indices = indices_sizes.index
-        sizes = indices_sizes.values
-        max_size = max(sizes)
-        cum_sizes = sizes.cumsum()
-        dates = df.index.get_level_values("ds")[cum_sizes - 1]
-        indptr = np.append(0, cum_sizes).astype(np.int32)
+        # Create auxiliary temporal indices 'indptr' from the codes' runs
+        starts = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        indptr = np.hstack([0, starts, len(codes)]).astype(np.int32)
+        sizes = np.diff(indptr)
+        max_size = sizes.max()
+        indices = pd.Index(uniques.take(codes[indptr[:-1]]), name="unique_id")
+        dates = pd.Index(ds[indptr[1:] - 1], name="ds")
+
+        # Write the temporal block once, column by column, in its storage dtype
+        col_dtypes = _column_dtypes(dtype, temporal_cols)
+        columns = (
+            _check_storage_dtype(
+                col,
+                get_column(col) if order is None else get_column(col)[order],
+                col_dtype,
+            )
+            for col, col_dtype in zip(temporal_cols, col_dtypes)
+        )
+        groups = list(dict.fromkeys(col_dtypes)) or [torch.float32]
+        if sparse:
+            if len(groups) > 1:
+                raise Exception(
+                    "Sparse storage keeps every temporal column in the same dtype."
+                )
+            temporal = _SparseTemporal.from_columns(
+                columns, shape=(len(codes), len(temporal_cols)), dtype=groups[0]
+            )
+        elif len(groups) == 1:
+            temporal = torch.empty((len(codes), len(temporal_cols)), dtype=groups[0])
+            for j, values in enumerate(columns):
+                temporal[:, j] = torch.from_numpy(values)
+        else:
+            # One block per storage dtype, y stays float32 while flags are compressed
+            cols = [
+                [j for j, col_dtype in enumerate(col_dtypes) if col_dtype == group]
+                for group in groups
+            ]
+            temporal = _GroupedTemporal(
+                [
+                    torch.empty((len(codes), len(block_cols)), dtype=group)
+                    for group, block_cols in zip(groups, cols)
+                ],
+                cols,
+            )
+            for j, values in enumerate(columns):
+                temporal.blocks[temporal.block_idx[j]][
+                    :, temporal.block_pos[j]
+                ] = torch.from_numpy(values)
 
         # Static features
         if static_df is not None:
-            static = static_df.values
+            static = static_df.to_numpy(dtype=np.float32)
             static_cols = static_df.columns
         else:
             static = None
@@ -242,44 +1355,578 @@ class TimeSeriesDataset(Dataset):
             max_size=max_size,
             sorted=sort_df,
         )
-        return dataset, indices, dates, df.index
+        dataset.first_ds = ds[indptr[:-1]]
+        dataset.last_ds = dates.to_numpy()
+        dataset.freq = freq
+        if not dataset._regular():
+            # Gaps or irregular dates can't be rebuilt, the series keep them all
+            dataset._ds = ds
+        return dataset, indices, dates, ds
+
+# %% ../nbs/tsdataset.ipynb 16
+class TimeSeriesParquetDataset(IterableDataset):
+    """Streaming dataset of a directory of Parquet files partitioned by `unique_id`.
+
+    Series are read one partition at a time, only the `columns` are loaded
+    and a bounded shuffle buffer mixes the series, so panels larger than
+    memory can be used to `fit` the models. Each DataLoader worker streams
+    its own share of the partitions. The yielded items match
+    `TimeSeriesDataset.__getitem__`.
+
+    **Parameters:**<br>
+    `path`: str, directory with hive-style `unique_id=<id>` partitions, as written by `df.to_parquet(path, partition_cols=['unique_id'])`.<br>
+    `columns`: list of str, temporal columns to read, defaults to every column but `unique_id` and `ds`.<br>
+    `static_df`: pandas DataFrame, static features with `unique_id` column or index.<br>
+    `shuffle_buffer_size`: int=1024, number of series held to shuffle, 0 streams the partitions in order.<br>
+    """
+
+    def __init__(self, path, columns=None, static_df=None, shuffle_buffer_size=1024):
+        super().__init__()
+        import pyarrow.dataset as pds
+
+        dataset = pds.dataset(path, format="parquet", partitioning="hive")
+        if "unique_id" not in dataset.schema.names:
+            raise Exception(f"{path} must be partitioned by unique_id.")
+        if columns is None:
+            # Skip the indexes stored by pandas' to_parquet
+            columns = [
+                col
+                for col in dataset.schema.names
+                if col not in ["unique_id", "ds"]
+                and not col.startswith("__index_level_")
+            ]
+        self.temporal_cols = pd.Index(list(columns) + ["available_mask"])
+
+        # Partition files of each serie, only metadata is read
+        groups = {}
+        for fragment in dataset.get_fragments():
+            uid = pds.get_partition_keys(fragment.partition_expression)["unique_id"]
+            groups.setdefault(uid, []).append(fragment.path)
+        self.uids = sorted(groups)
+        self.paths = [groups[uid] for uid in self.uids]
+        self.n_groups = len(self.uids)
+
+        if static_df is not None:
+            if static_df.index.name != "unique_id":
+                static_df = static_df.set_index("unique_id")
+            self.static = torch.as_tensor(
+                static_df.loc[self.uids].to_numpy(dtype=np.float32)
+            )
+            self.static_cols = static_df.columns
+        else:
+            self.static = None
+            self.static_cols = None
+
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.shuffle = True
+        # Positions of the streamed series, None streams every serie
+        self.series = None
+
+    def _read_serie(self, idx):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = ["ds"] + self.temporal_cols[:-1].tolist()
+        table = pa.concat_tables(
+            [pq.read_table(path, columns=columns) for path in self.paths[idx]]
+        )
+        df = table.to_pandas()
+        if not df["ds"].is_monotonic_increasing:
+            df = df.sort_values("ds")
 
-# %% ../nbs/tsdataset.ipynb 10
+        # Same layout as TimeSeriesDataset.__getitem__
+        temporal = torch.as_tensor(df[columns[1:]].to_numpy(dtype=np.float32).T)
+        static = None if self.static is None else self.static[idx, :]
+        return dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+        )
+
+    def __iter__(self):
+        # Each worker streams every num_workers-th serie
+        idxs = (
+            np.arange(self.n_groups) if self.series is None else np.asarray(self.series)
+        )
+        worker_info = torch.utils.data.get_worker_info()
+        if worker_info is not None:
+            idxs = idxs[worker_info.id :: worker_info.num_workers]
+
+        if not self.shuffle or self.shuffle_buffer_size == 0:
+            for idx in idxs:
+                yield self._read_serie(idx)
+            return
+
+        buffer = []
+        for idx in idxs[torch.randperm(len(idxs)).numpy()]:
+            item = self._read_serie(idx)
+            if len(buffer) < self.shuffle_buffer_size:
+                buffer.append(item)
+                continue
+            j = int(torch.randint(len(buffer), size=(1,)))
+            yield buffer[j]
+            buffer[j] = item
+        for j in torch.randperm(len(buffer)).tolist():
+            yield buffer[j]
+
+    def __len__(self):
+        return self.n_groups if self.series is None else len(self.series)
+
+# %% ../nbs/tsdataset.ipynb 18
+class LengthBucketSampler(Sampler):
+    """Sampler that orders the series so that batches hold similar lengths.
+
+    Series are sorted by length within buckets of `bucket_size` batches, so
+    `TimeSeriesLoader` only pads each batch to its own longest serie.
+    With `shuffle=True` the buckets are drawn at random every epoch and
+    the order of the full batches is shuffled, otherwise the series are
+    sorted by length.
+
+    **Parameters:**<br>
+    `lengths`: np.ndarray, length of each serie of the dataset.<br>
+    `batch_size`: int, number of series per batch.<br>
+    `shuffle`: bool=False, set to `True` to draw random buckets and batches.<br>
+    `bucket_size`: int=100, number of batches per shuffled bucket.<br>
+    """
+
+    def __init__(self, lengths, batch_size, shuffle=False, bucket_size=100):
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.bucket_size = bucket_size
+
+    def __iter__(self):
+        if not self.shuffle:
+            return iter(np.argsort(self.lengths, kind="stable").tolist())
+
+        n_series = len(self.lengths)
+        idxs = torch.randperm(n_series).numpy()
+        bucket = self.batch_size * self.bucket_size
+        buckets = np.split(idxs, range(bucket, n_series, bucket))
+        idxs = np.concatenate(
+            [b[np.argsort(self.lengths[b], kind="stable")] for b in buckets]
+        )
+
+        # Shuffle the full batches, the last non-full batch stays last
+        n_full = n_series // self.batch_size
+        batches = idxs[: n_full * self.batch_size].reshape(n_full, self.batch_size)
+        batches = batches[torch.randperm(n_full).numpy()]
+        idxs = np.concatenate([batches.flatten(), idxs[n_full * self.batch_size :]])
+        return iter(idxs.tolist())
+
+    def __len__(self):
+        return len(self.lengths)
+
+# %% ../nbs/tsdataset.ipynb 20
+class TimeSeriesWindowDataset(Dataset):
+    """Training windows of a `TimeSeriesDataset`, gathered on demand.
+
+    Holds a global index of the valid `(serie, offset)` windows: window `k`
+    of serie `i` is the global window `window_ptr[i] + k`, its insample
+    starts `k * step_size - (input_size - 1)` steps after the serie's first
+    row. A window is valid when its insample holds a step and its horizon an
+    observed `y` before the `cutoff`, read from the dataset's `summary`. The
+    steps before the serie's first row are masked as padding, missing `y`
+    values are kept like in the other batches of the dataset. Indexing with
+    an array of global windows gathers only those windows from `temporal`.
+
+    **Parameters:**<br>
+    `dataset`: `TimeSeriesDataset`, panel to draw the windows from.<br>
+    `input_size`: int, insample size of the windows.<br>
+    `h`: int, horizon of the windows.<br>
+    `step_size`: int=1, step between consecutive windows of a serie.<br>
+    `cutoff`: int=0, last steps of every serie left out of the windows.<br>
+    `temporal_cols`: list, optional, temporal columns of the windows, defaults to every column.<br>
+    `static_cols`: list, optional, static columns of the windows, defaults to every static column.<br>
+    """
+
+    def __init__(
+        self,
+        dataset,
+        input_size,
+        h,
+        step_size=1,
+        cutoff=0,
+        temporal_cols=None,
+        static_cols=None,
+    ):
+        super().__init__()
+        self.dataset = dataset
+        self.input_size = input_size
+        self.h = h
+        self.step_size = step_size
+        self.temporal_idx, self.temporal_cols = _select_columns(
+            dataset.temporal_cols[:-1], temporal_cols
+        )
+        self.temporal_cols = self.temporal_cols.append(dataset.temporal_cols[-1:])
+        self.static_idx, self.static_cols = None, None
+        if dataset.static is not None:
+            self.static_idx, self.static_cols = _select_columns(
+                dataset.static_cols, static_cols
+            )
+        self.sizes = dataset.summary["size"].to_numpy() - cutoff
+        # First window whose horizon reaches the serie's first observed y
+        first_valid = dataset.summary["first_valid"].to_numpy()
+        if "y" not in dataset.temporal_cols:
+            first_valid = np.zeros_like(first_valid)
+        self.first_window = np.maximum(-((h - first_valid) // step_size), 0)
+        n_windows = np.maximum((self.sizes - 2) // step_size + 1 - self.first_window, 0)
+        n_windows[first_valid >= self.sizes] = 0
+        self.window_ptr = np.append(0, np.cumsum(n_windows))
+
+    def __getitem__(self, idxs):
+        # [W] global windows -> [W, L+H] positions in their serie
+        idxs = np.atleast_1d(idxs)
+        series = np.searchsorted(self.window_ptr, idxs, side="right") - 1
+        windows = idxs - self.window_ptr[series] + self.first_window[series]
+        starts = windows * self.step_size - (self.input_size - 1)
+        steps = starts[:, None] + np.arange(self.input_size + self.h)
+        available = (steps >= 0) & (steps < self.sizes[series, None])
+        rows = self.dataset.indptr[series, None] + np.where(available, steps, 0)
+
+        # [W, L+H, C] in storage dtype -> [W, L+H, C+1] with the available_mask
+        available = torch.from_numpy(available)
+        rows = torch.from_numpy(rows)
+        temporal = self.dataset._take(rows, self.temporal_idx)
+        windows = torch.empty(
+            (*rows.shape, len(self.temporal_cols)), dtype=torch.float32
+        )
+        windows[..., :-1] = temporal.masked_fill(~available[..., None], 0)
+        windows[..., -1] = available
+
+        # Static rows of the windows' series, the windows keep their serie index
+        static, serie_idx = None, None
+        if self.static_cols is not None and len(self.static_cols) > 0:
+            series, serie_idx = np.unique(series, return_inverse=True)
+            static = self.dataset.static[torch.from_numpy(series)]
+            if self.static_idx is not None:
+                static = static[:, self.static_idx]
+            serie_idx = torch.from_numpy(serie_idx)
+
+        windows_batch = dict(
+            temporal=windows,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+            serie_idx=serie_idx,
+        )
+        return windows_batch
+
+    def __len__(self):
+        return self.window_ptr[-1]
+
+# %% ../nbs/tsdataset.ipynb 22
+class TimeSeriesWindowBank(Dataset):
+    """Windows of a `TimeSeriesWindowDataset` with statistics computed once.
+
+    For panels that fit in memory, the windows are built chunk by chunk and
+    passed through `transform`, for instance the model's normalization. Only
+    the per window tensors it adds, like the `[W, 1, C]` `x_shift` and
+    `x_scale` of the scaler, are stored. Indexing with an array of global
+    windows, as drawn by `TimeSeriesWindowSampler`, gathers the windows from
+    `temporal` and passes them through `transform` with their statistics,
+    that it applies instead of computing them again.
+
+    **Parameters:**<br>
+    `windows`: `TimeSeriesWindowDataset`, windows to draw from.<br>
+    `transform`: callable, optional, applied to each chunk of windows, with their statistics once stored.<br>
+    `chunk_size`: int=65536, number of windows gathered and transformed at once.<br>
+    """
+
+    _window_keys = ["temporal", "temporal_cols", "static", "static_cols", "serie_idx"]
+
+    def __init__(self, windows, transform=None, chunk_size=65536):
+        super().__init__()
+        if len(windows) == 0:
+            raise Exception("No windows available for training")
+        self.windows = windows
+        self.transform = transform
+        self.window_ptr = windows.window_ptr
+
+        # Per window statistics of the transformed chunks, e.g. x_shift and x_scale
+        chunks = []
+        for start in range(0, len(windows), chunk_size):
+            chunk = windows[np.arange(start, min(start + chunk_size, len(windows)))]
+            if transform is not None:
+                chunk = transform(chunk)
+            chunks.append(
+                {
+                    key: value
+                    for key, value in chunk.items()
+                    if key not in self._window_keys
+                }
+            )
+        self.stats = {
+            key: torch.cat([chunk[key] for chunk in chunks]) for key in chunks[0]
+        }
+
+    def __getitem__(self, idxs):
+        idxs = np.atleast_1d(idxs)
+        windows_batch = self.windows[idxs]
+        windows_batch.update(
+            {key: value[torch.as_tensor(idxs)] for key, value in self.stats.items()}
+        )
+        if self.transform is not None:
+            windows_batch = self.transform(windows_batch)
+        return windows_batch
+
+    def __len__(self):
+        return self.window_ptr[-1]
+
+# %% ../nbs/tsdataset.ipynb 24
+class TimeSeriesWindowSampler(Sampler):
+    """Sampler of batches of global windows of a `TimeSeriesWindowDataset`.
+
+    Every batch draws `windows_batch_size` windows among the windows of
+    `batch_size` random series, as if all the windows of those series were
+    unfolded and subsampled, while only the drawn windows are gathered.
+    Each step then costs `windows_batch_size` windows whatever the length
+    of the series.
+
+    **Parameters:**<br>
+    `window_ptr`: np.ndarray, `TimeSeriesWindowDataset.window_ptr` of the windows.<br>
+    `batch_size`: int, number of series per batch.<br>
+    `windows_batch_size`: int=None, number of windows per batch, None uses every window of the series.<br>
+    `drop_last`: bool=False, set to `True` to drop the last batch of less than `batch_size` series.<br>
+    """
+
+    def __init__(
+        self, window_ptr, batch_size, windows_batch_size=None, drop_last=False
+    ):
+        self.window_ptr = np.asarray(window_ptr)
+        self.batch_size = batch_size
+        self.windows_batch_size = windows_batch_size
+        self.drop_last = drop_last
+
+    def __iter__(self):
+        n_windows = np.diff(self.window_ptr)
+        series = torch.randperm(len(n_windows)).numpy()
+        # Generator.choice draws without replacement in O(windows_batch_size)
+        rng = np.random.default_rng(torch.randint(2**31, ()).item())
+        for i in range(len(self)):
+            batch = series[i * self.batch_size : (i + 1) * self.batch_size]
+            batch_windows = np.cumsum(n_windows[batch])
+            total = batch_windows[-1]
+            if total == 0:
+                raise Exception("No windows available for training")
+
+            if self.windows_batch_size is None:
+                w_idxs = np.arange(total)
+            else:
+                w_idxs = rng.choice(
+                    total,
+                    size=self.windows_batch_size,
+                    replace=(total < self.windows_batch_size),
+                )
+
+            # Batch window -> serie of the batch -> global window
+            pos = np.searchsorted(batch_windows, w_idxs, side="right")
+            yield self.window_ptr[batch[pos]] + w_idxs - batch_windows[pos] + n_windows[
+                batch[pos]
+            ]
+
+    def __len__(self):
+        n_series = len(self.window_ptr) - 1
+        if self.drop_last:
+            return n_series // self.batch_size
+        return int(np.ceil(n_series / self.batch_size))
+
+# %% ../nbs/tsdataset.ipynb 26
 class TimeSeriesDataModule(pl.LightningDataModule):
     def __init__(
-        self, dataset: TimeSeriesDataset, batch_size=32, num_workers=0, drop_last=False
+        self,
+        dataset: TimeSeriesDataset,
+        batch_size=32,
+        num_workers=0,
+        drop_last=False,
+        bucket_by_length=False,
+        windows=None,
+        windows_batch_size=None,
+        temporal_cols=None,
+        static_cols=None,
+        tail_size=None,
+        train_transform=None,
+        windows_bank=False,
+        val_series=None,
     ):
         super().__init__()
         self.dataset = dataset
         self.batch_size = batch_size
         self.num_workers = num_workers
         self.drop_last = drop_last
+        # Streaming datasets are read in partition order, without length buckets
+        self.bucket_by_length = bucket_by_length and not isinstance(
+            dataset, IterableDataset
+        )
+        # Columns read by the model, the loaders only yield these
+        self.temporal_cols = temporal_cols
+        self.static_cols = static_cols
+        # Predict batches only hold the last tail_size steps of the series
+        self.tail_size = tail_size
+        # TimeSeriesWindowDataset arguments to train on sampled windows
+        self.windows = windows
+        self.windows_batch_size = windows_batch_size
+        # Applied to the train batches by the DataLoader workers, that
+        # prepare them while the main process runs the optimizer steps
+        self.train_transform = train_transform
+        # Compute the statistics of every window once, in a TimeSeriesWindowBank
+        self.windows_bank = windows_bank
+        # Series of the validation batches, defaults to every serie
+        self.val_series = val_series
+        self.sample_windows = (windows is not None) and not isinstance(
+            dataset, IterableDataset
+        )
+
+        # Forked workers share the parent's memory, others attach to shared memory
+        start_method = (
+            multiprocessing.get_start_method(allow_none=True)
+            or multiprocessing.get_all_start_methods()[0]
+        )
+        if (
+            num_workers > 0
+            and start_method != "fork"
+            and isinstance(dataset, TimeSeriesDataset)
+        ):
+            dataset.share_memory()
+
+    def _bucket_sampler(self, shuffle):
+        if not self.bucket_by_length:
+            return None
+        return LengthBucketSampler(
+            lengths=self.dataset.summary["size"].to_numpy(),
+            batch_size=self.batch_size,
+            shuffle=shuffle,
+        )
+
+    def _iterable_loader(
+        self,
+        shuffle,
+        drop_last,
+        tail_size=None,
+        transform=None,
+        num_workers=None,
+        series=None,
+    ):
+        # Streaming datasets shuffle with their own buffer and only read the `series`
+        dataset = copy.copy(self.dataset)
+        dataset.shuffle = shuffle
+        dataset.series = series
+        if self.temporal_cols is not None:
+            # Only the model's columns are read from the files
+            temporal_cols = _select_columns(
+                dataset.temporal_cols[:-1], self.temporal_cols
+            )[1]
+            dataset.temporal_cols = temporal_cols.append(dataset.temporal_cols[-1:])
+        loader = TimeSeriesLoader(
+            dataset,
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols,
+            tail_size=tail_size,
+            transform=transform,
+            batch_size=self.batch_size,
+            num_workers=self.num_workers if num_workers is None else num_workers,
+            drop_last=drop_last,
+        )
+        return loader
+
+    def _windows_loader(self):
+        # Batches are already gathered by the dataset, only transformed
+        windows = TimeSeriesWindowDataset(
+            self.dataset,
+            **self.windows,
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols
+        )
+        transform = self.train_transform
+        if self.windows_bank:
+            # The window statistics are computed once, the bank applies the transform
+            windows = TimeSeriesWindowBank(windows, transform=transform)
+            transform = None
+        sampler = TimeSeriesWindowSampler(
+            window_ptr=windows.window_ptr,
+            batch_size=self.batch_size,
+            windows_batch_size=self.windows_batch_size,
+            drop_last=self.drop_last,
+        )
+        loader = DataLoader(
+            windows,
+            batch_size=None,
+            sampler=sampler,
+            num_workers=self.num_workers,
+            collate_fn=transform,
+        )
+        return loader
 
     def train_dataloader(self):
+        if isinstance(self.dataset, IterableDataset):
+            return self._iterable_loader(
+                shuffle=True, drop_last=self.drop_last, transform=self.train_transform
+            )
+        if self.sample_windows:
+            return self._windows_loader()
+        sampler = self._bucket_sampler(shuffle=True)
         loader = TimeSeriesLoader(
             self.dataset,
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols,
+            transform=self.train_transform,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
-            shuffle=True,
+            shuffle=sampler is None,
+            sampler=sampler,
             drop_last=self.drop_last,
         )
         return loader
 
+    def _val_sampler(self):
+        if self.val_series is None:
+            return self._bucket_sampler(shuffle=False)
+        # Fixed subset of the series, sorted by length when bucketing
+        val_series = np.asarray(self.val_series)
+        if self.bucket_by_length:
+            lengths = np.diff(self.dataset.indptr)[val_series]
+            val_series = val_series[np.argsort(lengths, kind="stable")]
+        return val_series.tolist()
+
     def val_dataloader(self):
+        if isinstance(self.dataset, IterableDataset):
+            return self._iterable_loader(
+                shuffle=False, drop_last=self.drop_last, series=self.val_series
+            )
         loader = TimeSeriesLoader(
             self.dataset,
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
             shuffle=False,
+            sampler=self._val_sampler(),
             drop_last=self.drop_last,
         )
         return loader
 
     def predict_dataloader(self):
+        if isinstance(self.dataset, IterableDataset):
+            # Workers stream interleaved shares of the series, a single
+            # process keeps the forecasts in the order of the series
+            return self._iterable_loader(
+                shuffle=False, drop_last=False, tail_size=self.tail_size, num_workers=0
+            )
         loader = TimeSeriesLoader(
             self.dataset,
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols,
+            tail_size=self.tail_size,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
             shuffle=False,
+            sampler=self._bucket_sampler(shuffle=False),
         )
         return loader
+
+    def predict_order(self):
+        """Positions in the dataset of the series in `predict_dataloader` order."""
+        if self.bucket_by_length:
+            return np.array(list(self._bucket_sampler(shuffle=False)))
+        return np.arange(len(self.dataset))